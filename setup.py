@@ -168,6 +168,9 @@ setup(
         "tensorflow": [
             "tensorflow>=2.8.0",
         ],
+        "fast": [
+            "orjson>=3.0",
+        ],
     },
     entry_points={
         "console_scripts": [
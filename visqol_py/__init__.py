@@ -3,8 +3,46 @@
 __version__ = "3.3.4"
 __author__ = "Google Research (Original), Wrapper by Community"
 
-from .visqol import ViSQOL, ViSQOLMode, ViSQOLResult
-from .utils import load_audio, save_results
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .visqol import ViSQOL, ViSQOLMode, ViSQOLResult
+    from .utils import load_audio, save_results
+
+# Public names and the submodules defining them; submodules (and NumPy)
+# are only imported on first attribute access, which keeps
+# `import visqol_py` and `visqol-py --help` fast
+_LAZY_ATTRS = {
+    "ViSQOL": ".visqol",
+    "ViSQOLMode": ".visqol",
+    "ViSQOLResult": ".visqol",
+    "load_audio": ".utils",
+    "save_results": ".utils",
+}
+
+# Submodules that `import visqol_py` used to load eagerly and that callers
+# reach as attributes, e.g. `visqol_py.utils.load_audio`
+_LAZY_SUBMODULES = ("utils", "visqol")
+
+
+def __getattr__(name):
+    import importlib
+    
+    if name in _LAZY_SUBMODULES:
+        # Importing a submodule also binds it as a package attribute
+        return importlib.import_module("." + name, __name__)
+    
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRS) | set(_LAZY_SUBMODULES))
 
 __all__ = [
     "ViSQOL",
@@ -1,13 +1,11 @@
 """Command-line interface for ViSQOL-Py."""
 
 import argparse
+import os
 import sys
 from pathlib import Path
 from typing import List, Optional
 
-from .visqol import ViSQOL, ViSQOLMode
-from .utils import load_batch_csv, save_results
-
 
 def main():
     """Main CLI entry point."""
@@ -87,6 +85,13 @@ Examples:
         help='Use speech mode (16kHz) instead of audio mode (48kHz)'
     )
     
+    parser.add_argument(
+        '--jobs',
+        type=int,
+        default=os.cpu_count() or 1,
+        help='Number of worker processes for batch mode (default: CPU count)'
+    )
+    
     return parser
 
 
@@ -104,6 +109,10 @@ def run_single_mode(args):
     if not deg_path.exists():
         raise FileNotFoundError(f"Degraded file not found: {deg_path}")
     
+    # Imported here so that --help does not load NumPy or the native library
+    from .visqol import ViSQOL, ViSQOLMode
+    from .utils import save_results
+    
     # Initialize ViSQOL
     mode = ViSQOLMode.SPEECH if args.use_speech_mode else ViSQOLMode.AUDIO
     visqol = ViSQOL(mode=mode)
@@ -133,6 +142,11 @@ def run_batch_mode(args):
     if not args.batch_input_csv:
         raise ValueError("--batch_input_csv is required for batch mode")
     
+    # Imported here so that --help does not load NumPy or the native library
+    import numpy as np
+    from .visqol import ViSQOL, ViSQOLMode
+    from .utils import load_batch_csv, save_results
+    
     # Load file pairs
     csv_path = Path(args.batch_input_csv)
     if not csv_path.exists():
@@ -142,20 +156,21 @@ def run_batch_mode(args):
     if not file_pairs:
         raise ValueError("No valid file pairs found in CSV")
     
-    # Initialize ViSQOL
     mode = ViSQOLMode.SPEECH if args.use_speech_mode else ViSQOLMode.AUDIO
     visqol = ViSQOL(mode=mode)
     
     # Process all pairs
     print(f"Processing {len(file_pairs)} file pairs...")
-    results = visqol.measure_batch(file_pairs)
+    results = visqol.measure_batch(file_pairs, n_jobs=args.jobs)
     
     # Output results
     if args.verbose:
         print("\nResults:")
         print("-" * 80)
-        for result in results:
-            print(f"{result.reference_path} -> {result.degraded_path}: {result.moslqo:.6f}")
+        sys.stdout.writelines(
+            f"{result.reference_path} -> {result.degraded_path}: {result.moslqo:.6f}\n"
+            for result in results
+        )
     
     # Save results
     if args.results_csv:
@@ -163,10 +178,10 @@ def run_batch_mode(args):
         print(f"Results saved to: {args.results_csv}")
     else:
         # Print summary
-        scores = [r.moslqo for r in results]
-        print(f"Mean MOS-LQO: {sum(scores)/len(scores):.6f}")
-        print(f"Min MOS-LQO: {min(scores):.6f}")
-        print(f"Max MOS-LQO: {max(scores):.6f}")
+        scores = np.fromiter((r.moslqo for r in results), dtype=np.float64, count=len(results))
+        print(f"Mean MOS-LQO: {scores.mean():.6f}")
+        print(f"Min MOS-LQO: {scores.min():.6f}")
+        print(f"Max MOS-LQO: {scores.max():.6f}")
 
 
 if __name__ == '__main__':
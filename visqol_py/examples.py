@@ -12,9 +12,31 @@ from pathlib import Path
 # Import the ViSQOL wrapper
 try:
     from . import ViSQOL, ViSQOLMode, load_audio, save_results
+    from .utils import save_audio
 except ImportError:
     # For standalone execution
     from visqol_py import ViSQOL, ViSQOLMode, load_audio, save_results
+    from visqol_py.utils import save_audio
+
+
+# Seeded generator, so the examples print the same scores on every run
+_RNG = np.random.default_rng(0)
+
+
+def _tone(sample_rate, duration, freq, amp):
+    """Sine tone of the given frequency and amplitude, computed in place as float32."""
+    t = np.arange(int(sample_rate * duration), dtype=np.float32)
+    t *= np.float32(2 * np.pi * freq / sample_rate)
+    np.sin(t, out=t)
+    t *= amp
+    return t
+
+
+def _noise(n, level):
+    """White noise with standard deviation level, scaled in place as float32."""
+    noise = _RNG.standard_normal(n, dtype=np.float32)
+    noise *= level
+    return noise
 
 
 def example_basic_usage():
@@ -24,14 +46,13 @@ def example_basic_usage():
     # Create some test audio (sine waves)
     sample_rate = 48000
     duration = 5.0  # seconds
-    t = np.linspace(0, duration, int(sample_rate * duration))
     
     # Reference: clean sine wave
-    reference = np.sin(2 * np.pi * 440 * t)  # A4 note
+    reference = _tone(sample_rate, duration, 440, amp=1.0)  # A4 note
     
     # Degraded: same sine wave with added noise
     noise_level = 0.1
-    degraded = reference + noise_level * np.random.randn(len(reference))
+    degraded = reference + _noise(len(reference), noise_level)
     
     # Initialize ViSQOL in audio mode (48kHz)
     visqol = ViSQOL(mode=ViSQOLMode.AUDIO)
@@ -51,21 +72,21 @@ def example_speech_mode():
     # Create test speech-like signal (16kHz)
     sample_rate = 16000
     duration = 8.0
-    t = np.linspace(0, duration, int(sample_rate * duration))
     
     # Speech-like signal: mix of frequencies with amplitude modulation
-    reference = (
-        0.5 * np.sin(2 * np.pi * 200 * t) +  # Fundamental
-        0.3 * np.sin(2 * np.pi * 400 * t) +  # First harmonic
-        0.2 * np.sin(2 * np.pi * 600 * t)    # Second harmonic
-    )
+    reference = _tone(sample_rate, duration, 200, amp=0.5)  # Fundamental
+    reference += _tone(sample_rate, duration, 400, amp=0.3)  # First harmonic
+    reference += _tone(sample_rate, duration, 600, amp=0.2)  # Second harmonic
     
     # Add amplitude modulation to simulate speech patterns
-    envelope = 0.5 * (1 + np.sin(2 * np.pi * 3 * t))
+    envelope = _tone(sample_rate, duration, 3, amp=0.5)
+    envelope += 0.5
     reference *= envelope
     
     # Degraded version with compression artifacts
-    degraded = np.tanh(2 * reference) / 2  # Soft clipping
+    degraded = np.multiply(reference, 2.0)  # Soft clipping
+    np.tanh(degraded, out=degraded)
+    degraded *= 0.5
     
     # Initialize ViSQOL in speech mode
     visqol = ViSQOL(mode=ViSQOLMode.SPEECH)
@@ -92,18 +113,18 @@ def example_file_processing():
         # Generate test audio
         sample_rate = 48000
         duration = 6.0
-        t = np.linspace(0, duration, int(sample_rate * duration))
         
         # Reference: clean signal
-        reference = np.sin(2 * np.pi * 440 * t) * 0.7
+        reference = _tone(sample_rate, duration, 440, amp=0.7)
         
         # Degraded: add distortion
-        degraded = np.tanh(reference * 1.5) * 0.7
+        degraded = np.multiply(reference, 1.5)
+        np.tanh(degraded, out=degraded)
+        degraded *= 0.7
         
         # Save as WAV files
-        import soundfile as sf
-        sf.write(ref_path, reference, sample_rate)
-        sf.write(deg_path, degraded, sample_rate)
+        save_audio(reference, ref_path, sample_rate)
+        save_audio(degraded, deg_path, sample_rate)
         
         # Process with ViSQOL
         visqol = ViSQOL()
@@ -125,29 +146,33 @@ def example_batch_processing():
         # Create multiple test file pairs
         sample_rate = 48000
         duration = 4.0
-        t = np.linspace(0, duration, int(sample_rate * duration))
+        
+        # References: one row per pair, generated in a single 2-D sine call
+        freqs = np.array([440.0, 550.0, 660.0], dtype=np.float32)
+        references = np.outer(
+            freqs * np.float32(2 * np.pi / sample_rate),
+            np.arange(int(sample_rate * duration), dtype=np.float32),
+        )
+        np.sin(references, out=references)
+        references *= 0.7
+        
+        # Degraded with increasing noise levels per row, drawn in one call
+        noise_levels = 0.05 * np.arange(1, len(freqs) + 1, dtype=np.float32)
+        degraded = _RNG.standard_normal(references.shape, dtype=np.float32)
+        degraded *= noise_levels[:, None]
+        degraded += references
         
         file_pairs = []
         
-        for i in range(3):
-            # Different degradation levels
-            noise_level = 0.05 * (i + 1)  # Increasing noise
-            
+        for i in range(len(freqs)):
             ref_path = temp_path / f"ref_{i+1}.wav"
             deg_path = temp_path / f"deg_{i+1}.wav"
             
-            # Reference
-            reference = np.sin(2 * np.pi * (440 + i * 110) * t) * 0.7
-            
-            # Degraded with different noise levels
-            degraded = reference + noise_level * np.random.randn(len(reference))
-            
             # Save files
-            import soundfile as sf
-            sf.write(ref_path, reference, sample_rate)
-            sf.write(deg_path, degraded, sample_rate)
+            save_audio(references[i], ref_path, sample_rate)
+            save_audio(degraded[i], deg_path, sample_rate)
             
-            file_pairs.append((str(ref_path), str(deg_path)))
+            file_pairs.append((os.fspath(ref_path), os.fspath(deg_path)))
         
         # Process batch
         visqol = ViSQOL()
@@ -175,24 +200,27 @@ def example_parameter_exploration():
     
     sample_rate = 48000
     duration = 5.0
-    t = np.linspace(0, duration, int(sample_rate * duration))
     
     # Create reference signal
-    reference = np.sin(2 * np.pi * 440 * t) * 0.7
+    reference = _tone(sample_rate, duration, 440, amp=0.7)
+    
+    # Hard clipping, computed in a single buffer
+    clipped = np.multiply(reference, 2.0)
+    np.clip(clipped, -0.8, 0.8, out=clipped)
     
     # Test different degradation types
     degradations = {
-        "Low Noise": reference + 0.02 * np.random.randn(len(reference)),
-        "High Noise": reference + 0.15 * np.random.randn(len(reference)),
-        "Clipping": np.clip(reference * 2, -0.8, 0.8),
+        "Low Noise": reference + _noise(len(reference), 0.02),
+        "High Noise": reference + _noise(len(reference), 0.15),
+        "Clipping": clipped,
         "Low-pass": None,  # Will be created using scipy
     }
     
     # Create low-pass filtered version
     try:
         from scipy import signal
-        b, a = signal.butter(5, 8000, fs=sample_rate, btype='low')
-        degradations["Low-pass"] = signal.filtfilt(b, a, reference)
+        sos = signal.butter(5, 8000, fs=sample_rate, btype='low', output='sos')
+        degradations["Low-pass"] = signal.sosfiltfilt(sos, reference)
     except ImportError:
         print("Scipy not available, skipping low-pass filter example")
         del degradations["Low-pass"]
@@ -200,11 +228,13 @@ def example_parameter_exploration():
     # Initialize ViSQOL
     visqol = ViSQOL()
     
+    # Score every degradation against the same reference in one call
+    degradations = {k: v for k, v in degradations.items() if v is not None}
+    results = visqol.measure_against_reference(reference, list(degradations.values()))
+    
     print("Degradation Type vs MOS-LQO Score:")
-    for deg_type, degraded in degradations.items():
-        if degraded is not None:
-            result = visqol.measure(reference, degraded)
-            print(f"  {deg_type:12}: {result.moslqo:.3f}")
+    for deg_type, result in zip(degradations, results):
+        print(f"  {deg_type:12}: {result.moslqo:.3f}")
     print()
 
 
@@ -220,9 +250,8 @@ def example_comparing_modes():
     duration = 6.0
     
     # Create reference signal at 48kHz
-    t_high = np.linspace(0, duration, int(sample_rate_high * duration))
-    reference_48k = np.sin(2 * np.pi * 440 * t_high) * 0.7
-    degraded_48k = reference_48k + 0.05 * np.random.randn(len(reference_48k))
+    reference_48k = _tone(sample_rate_high, duration, 440, amp=0.7)
+    degraded_48k = reference_48k + _noise(len(reference_48k), 0.05)
     
     # Downsample for speech mode
     from scipy import signal as scipy_signal
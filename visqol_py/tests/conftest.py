@@ -0,0 +1,62 @@
+"""Shared fixtures for ViSQOL-Py tests."""
+
+import pytest
+import numpy as np
+
+from visqol_py import ViSQOL, ViSQOLMode
+
+
+def _tone(sample_rate, duration, freq, amp=1.0):
+    """Generate a float32 sine tone, computing the phase and sine in place."""
+    signal = np.arange(int(sample_rate * duration), dtype=np.float32)
+    signal *= np.float32(2 * np.pi * freq / sample_rate)
+    np.sin(signal, out=signal)
+    signal *= amp
+    return signal
+
+
+@pytest.fixture(scope="session")
+def tone():
+    """Factory for sine tones: tone(sample_rate, duration, freq, amp=1.0)."""
+    return _tone
+
+
+@pytest.fixture
+def noise():
+    """Factory for seeded white noise: noise(n, level), a new array per call."""
+    rng = np.random.default_rng(0)
+    
+    def make_noise(n, level):
+        signal = rng.standard_normal(n, dtype=np.float32)
+        signal *= level
+        return signal
+    
+    return make_noise
+
+
+@pytest.fixture(scope="session")
+def tone_48k():
+    """Two-second 440 Hz reference at 48kHz and a noisy degraded copy."""
+    reference = _tone(48000, 2.0, 440, amp=0.7)
+    
+    rng = np.random.default_rng(0)
+    degraded = rng.standard_normal(reference.shape, dtype=np.float32)
+    degraded *= 0.05
+    degraded += reference
+    
+    # Shared across the session, so guard against accidental mutation
+    reference.flags.writeable = False
+    degraded.flags.writeable = False
+    return reference, degraded
+
+
+@pytest.fixture(scope="session")
+def visqol_audio():
+    """ViSQOL instance in audio mode, shared across the session."""
+    return ViSQOL(mode=ViSQOLMode.AUDIO)
+
+
+@pytest.fixture(scope="session")
+def visqol_speech():
+    """ViSQOL instance in speech mode, shared across the session."""
+    return ViSQOL(mode=ViSQOLMode.SPEECH)
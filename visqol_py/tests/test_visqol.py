@@ -1,143 +1,237 @@
 """Tests for ViSQOL-Py wrapper."""
 
+import json
 import pytest
 import numpy as np
 import tempfile
 from pathlib import Path
 
 from visqol_py import ViSQOL, ViSQOLMode, ViSQOLResult
+from visqol_py import utils
+from visqol_py.utils import (
+    compute_audio_stats, compute_audio_stats_batch, load_audio, load_batch_csv,
+    resample_audio, save_audio, save_results, validate_audio_files,
+)
 
 
 class TestViSQOL:
     """Test cases for ViSQOL class."""
     
-    def test_init_audio_mode(self):
-        """Test initialization in audio mode."""
-        visqol = ViSQOL(mode=ViSQOLMode.AUDIO)
-        assert visqol.mode == ViSQOLMode.AUDIO
+    @pytest.mark.parametrize("mode", [ViSQOLMode.AUDIO, ViSQOLMode.SPEECH])
+    def test_init(self, mode):
+        """Test initialization in each mode."""
+        visqol = ViSQOL(mode=mode)
+        assert visqol.mode == mode
     
-    def test_init_speech_mode(self):
-        """Test initialization in speech mode."""
-        visqol = ViSQOL(mode=ViSQOLMode.SPEECH)
-        assert visqol.mode == ViSQOLMode.SPEECH
-    
-    def test_measure_with_arrays(self):
-        """Test measure method with numpy arrays."""
-        visqol = ViSQOL()
+    def test_pickle_roundtrip(self, visqol_speech):
+        """Test that pickling keeps the settings and rebuilds the native API."""
+        import pickle
         
-        # Create test signals
-        sample_rate = 48000
-        duration = 2.0
-        t = np.linspace(0, duration, int(sample_rate * duration))
+        restored = pickle.loads(pickle.dumps(visqol_speech))
         
-        reference = np.sin(2 * np.pi * 440 * t)
-        degraded = reference + 0.1 * np.random.randn(len(reference))
+        assert restored.mode == ViSQOLMode.SPEECH
+        assert restored.max_segment_seconds == visqol_speech.max_segment_seconds
+        assert restored._api is not visqol_speech._api
+    
+    def test_measure_with_arrays(self, visqol_audio, tone_48k):
+        """Test measure method with numpy arrays."""
+        reference, degraded = tone_48k
         
-        result = visqol.measure(reference, degraded)
+        result = visqol_audio.measure(reference, degraded)
         
         assert isinstance(result, ViSQOLResult)
         assert 1.0 <= result.moslqo <= 5.0
     
-    def test_measure_identical_signals(self):
+    def test_measure_identical_signals(self, visqol_audio, tone_48k):
         """Test measure with identical signals."""
-        visqol = ViSQOL()
+        signal, _ = tone_48k
         
-        # Create identical signals
-        sample_rate = 48000
-        duration = 2.0
-        t = np.linspace(0, duration, int(sample_rate * duration))
-        signal = np.sin(2 * np.pi * 440 * t)
-        
-        result = visqol.measure(signal, signal)
+        result = visqol_audio.measure(signal, signal)
         
         # Identical signals should have high quality scores
         assert result.moslqo >= 4.0
     
-    def test_measure_with_files(self):
+    def test_measure_with_files(self, visqol_audio, tone_48k):
         """Test measure method with audio files."""
-        visqol = ViSQOL()
+        reference, degraded = tone_48k
         
         with tempfile.TemporaryDirectory() as temp_dir:
             # Create temporary audio files
             ref_path = Path(temp_dir) / "ref.wav"
             deg_path = Path(temp_dir) / "deg.wav"
             
-            # Generate test audio
-            sample_rate = 48000
-            duration = 2.0
-            t = np.linspace(0, duration, int(sample_rate * duration))
-            
-            reference = np.sin(2 * np.pi * 440 * t)
-            degraded = reference + 0.05 * np.random.randn(len(reference))
-            
             # Save as WAV files
-            import soundfile as sf
-            sf.write(ref_path, reference, sample_rate)
-            sf.write(deg_path, degraded, sample_rate)
+            save_audio(reference, ref_path, 48000)
+            save_audio(degraded, deg_path, 48000)
             
             # Test measure
-            result = visqol.measure(ref_path, deg_path)
+            result = visqol_audio.measure(ref_path, deg_path)
             
             assert isinstance(result, ViSQOLResult)
             assert 1.0 <= result.moslqo <= 5.0
             assert result.reference_path == str(ref_path)
             assert result.degraded_path == str(deg_path)
     
-    def test_measure_batch(self):
+    def test_measure_batch(self, visqol_audio, tone, noise):
         """Test batch processing."""
-        visqol = ViSQOL()
+        # Array pairs skip the WAV encode/decode round-trip; file I/O is
+        # covered by test_measure_with_files
+        sample_rate = 48000
+        duration = 1.0
+        pairs = []
+        for i in range(3):
+            reference = tone(sample_rate, duration, 440 + i * 110)
+            degraded = reference + noise(len(reference), 0.05 * i)
+            pairs.append((reference, degraded))
         
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-            
-            # Create test file pairs
-            file_pairs = []
-            for i in range(3):
-                ref_path = temp_path / f"ref_{i}.wav"
-                deg_path = temp_path / f"deg_{i}.wav"
-                
-                # Generate different test signals
-                sample_rate = 48000
-                duration = 1.0
-                t = np.linspace(0, duration, int(sample_rate * duration))
-                
-                reference = np.sin(2 * np.pi * (440 + i * 110) * t)
-                degraded = reference + (0.05 * i) * np.random.randn(len(reference))
-                
-                import soundfile as sf
-                sf.write(ref_path, reference, sample_rate)
-                sf.write(deg_path, degraded, sample_rate)
-                
-                file_pairs.append((str(ref_path), str(deg_path)))
-            
-            # Test batch processing
-            results = visqol.measure_batch(file_pairs)
-            
-            assert len(results) == 3
-            for result in results:
-                assert isinstance(result, ViSQOLResult)
-                assert 1.0 <= result.moslqo <= 5.0
+        # Test batch processing; any iterable of pairs is accepted
+        results = visqol_audio.measure_batch(iter(pairs))
+        
+        assert len(results) == 3
+        for result in results:
+            assert isinstance(result, ViSQOLResult)
+            assert 1.0 <= result.moslqo <= 5.0
+            assert result.reference_path is None
     
-    def test_speech_mode(self):
-        """Test speech mode functionality."""
-        visqol = ViSQOL(mode=ViSQOLMode.SPEECH)
+    def test_measure_batch_shared_reference(self, visqol_audio, tone_48k, tmp_path):
+        """Test batch file pairs sharing a reference, streamed to CSV."""
+        reference, degraded = tone_48k
+        ref_path = tmp_path / "ref.wav"
+        save_audio(reference, ref_path, 48000)
+        pairs = []
+        for i in range(2):
+            deg_path = tmp_path / f"deg{i}.wav"
+            save_audio(degraded, deg_path, 48000)
+            pairs.append((ref_path, deg_path))
+        output_csv = tmp_path / "results.csv"
+        
+        results = visqol_audio.measure_batch(pairs, output_csv=output_csv)
+        
+        assert results[0].moslqo == pytest.approx(results[1].moslqo)
+        rows = output_csv.read_text().splitlines()
+        assert rows[0] == "reference,degraded,moslqo"
+        assert len(rows) == 3
+    
+    def test_measure_against_reference(self, visqol_audio, tone_48k, noise):
+        """Test measuring several degraded signals against one reference."""
+        reference, degraded = tone_48k
+        
+        results = visqol_audio.measure_against_reference(
+            reference, [degraded, reference + noise(len(reference), 0.1)]
+        )
+        
+        assert len(results) == 2
+        for result in results:
+            assert isinstance(result, ViSQOLResult)
+            assert 1.0 <= result.moslqo <= 5.0
+    
+    def test_measure_with_cache_dir(self, tone_48k, tmp_path):
+        """Test that repeated file measurements are served from the cache."""
+        reference, degraded = tone_48k
+        ref_path = tmp_path / "ref.wav"
+        deg_path = tmp_path / "deg.wav"
+        save_audio(reference, ref_path, 48000)
+        save_audio(degraded, deg_path, 48000)
         
+        visqol = ViSQOL(mode=ViSQOLMode.AUDIO, cache_dir=tmp_path / "cache")
+        first = visqol.measure(ref_path, deg_path)
+        assert len(list((tmp_path / "cache").glob("*.json"))) == 1
+        
+        second = visqol.measure(str(ref_path), str(deg_path))
+        assert second.moslqo == first.moslqo
+        assert second.fvnsim == first.fvnsim
+        assert second.degraded_path == str(deg_path)
+    
+    def test_measure_segmented(self, tone_48k):
+        """Test segmented measurement of inputs longer than max_segment_seconds."""
+        reference, degraded = tone_48k
+        visqol = ViSQOL(mode=ViSQOLMode.AUDIO, max_segment_seconds=1.0)
+        
+        result = visqol.measure(reference, degraded)
+        
+        assert 1.0 <= result.moslqo <= 5.0
+        assert len(result.fvnsim) == len(result.center_freq_bands)
+    
+    @pytest.mark.parametrize("n_samples, expected", [
+        (100, [(0, 40), (30, 70), (60, 100)]),
+        (105, [(0, 40), (30, 70), (60, 105)]),
+        (30, [(0, 30)]),
+    ])
+    def test_segment_bounds(self, n_samples, expected):
+        """Test overlapping segmentation, merging a short tail."""
+        from visqol_py.visqol import _segment_bounds
+        
+        assert _segment_bounds(n_samples, 40, 10) == expected
+    
+    @pytest.mark.parametrize("max_segment_seconds", [0, -1.0, 0.1])
+    def test_invalid_max_segment_seconds(self, max_segment_seconds):
+        """Test that segments shorter than one native patch are rejected."""
+        from visqol_py.visqol import _segment_bounds
+        
+        with pytest.raises(ValueError, match="max_segment_seconds"):
+            ViSQOL(mode=ViSQOLMode.AUDIO, max_segment_seconds=max_segment_seconds)
+        with pytest.raises(ValueError):
+            _segment_bounds(100, 0, 10)
+    
+    def test_check_batch_files(self, tmp_path):
+        """Test that missing batch files are reported before measuring."""
+        from visqol_py.visqol import _check_batch_files
+        
+        ref_path = tmp_path / "ref.wav"
+        save_audio(np.zeros(480, dtype=np.float32), ref_path, 48000)
+        _check_batch_files([(ref_path, np.zeros(480))])
+        
+        with pytest.raises(FileNotFoundError, match="missing.wav"):
+            _check_batch_files([(ref_path, tmp_path / "missing.wav")])
+        
+        # Raised by the call itself, even for a one-shot generator of pairs;
+        # validation needs no native API
+        visqol = ViSQOL.__new__(ViSQOL)
+        pairs = ((ref_path, deg_path) for deg_path in [tmp_path / "missing.wav"])
+        with pytest.raises(FileNotFoundError, match="missing.wav"):
+            visqol.iter_measure_batch(pairs)
+    
+    def test_is_same_audio(self, tmp_path):
+        """Test detection of pairs that name the same file or array."""
+        from visqol_py.visqol import _is_same_audio
+        
+        ref_path = tmp_path / "ref.wav"
+        save_audio(np.zeros(480, dtype=np.float32), ref_path, 48000)
+        signal = np.zeros(480)
+        
+        assert _is_same_audio(ref_path, str(tmp_path / "." / "ref.wav"))
+        assert _is_same_audio(signal, signal)
+        assert not _is_same_audio(signal, signal.copy())
+        assert not _is_same_audio(ref_path, tmp_path / "missing.wav")
+    
+    def test_speech_mode(self, visqol_speech, tone, noise):
+        """Test speech mode functionality."""
         # Create speech-like signal at 16kHz
         sample_rate = 16000
         duration = 2.0
-        t = np.linspace(0, duration, int(sample_rate * duration))
         
         # Speech-like signal with harmonics
-        reference = (
-            0.5 * np.sin(2 * np.pi * 200 * t) +
-            0.3 * np.sin(2 * np.pi * 400 * t)
-        )
-        degraded = reference + 0.05 * np.random.randn(len(reference))
+        reference = tone(sample_rate, duration, 200, amp=0.5)
+        reference += tone(sample_rate, duration, 400, amp=0.3)
+        degraded = reference + noise(len(reference), 0.05)
         
-        result = visqol.measure(reference, degraded)
+        result = visqol_speech.measure(reference, degraded)
         
         assert isinstance(result, ViSQOLResult)
         assert 1.0 <= result.moslqo <= 5.0
+    
+    def test_speech_mode_mismatched_rates(self, visqol_speech, tone, tmp_path):
+        """Test that a degraded file is resampled to the reference's rate."""
+        reference = tone(48000, 2.0, 200, amp=0.5)
+        degraded = tone(44100, 2.0, 200, amp=0.5)
+        ref_path = tmp_path / "ref.wav"
+        deg_path = tmp_path / "deg.wav"
+        save_audio(reference, ref_path, 48000)
+        save_audio(degraded, deg_path, 44100)
+        
+        result = visqol_speech.measure(ref_path, deg_path)
+        
+        assert 1.0 <= result.moslqo <= 5.0
 
 
 class TestViSQOLResult:
@@ -161,6 +255,260 @@ class TestViSQOLResult:
         assert "0.800" in str_repr
 
 
+class TestUtils:
+    """Test cases for utility functions."""
+    
+    def test_package_exposes_submodules(self):
+        """Test that submodules stay reachable as package attributes."""
+        import visqol_py
+        
+        assert visqol_py.utils is utils
+        assert visqol_py.visqol.ViSQOL is ViSQOL
+        assert {"utils", "visqol"} <= set(dir(visqol_py))
+    
+    @pytest.mark.parametrize("chunk_bytes", [1 << 20, 6, 3])
+    def test_load_audio_24bit(self, monkeypatch, chunk_bytes):
+        """Test decoding of signed 24-bit PCM samples."""
+        import wave
+        
+        monkeypatch.setattr(utils, "_DECODE_CHUNK_BYTES", chunk_bytes)
+        samples = np.array([0, 1, -1, 8388607, -8388608, 4660, -4660], dtype=np.int32)
+        payload = b"".join(int(v).to_bytes(3, "little", signed=True) for v in samples)
+        
+        with tempfile.TemporaryDirectory() as temp_dir:
+            wav_path = Path(temp_dir) / "pcm24.wav"
+            with wave.open(str(wav_path), "wb") as wav_file:
+                wav_file.setnchannels(1)
+                wav_file.setsampwidth(3)
+                wav_file.setframerate(16000)
+                wav_file.writeframes(payload)
+            
+            audio, sample_rate = load_audio(wav_path)
+        
+        assert sample_rate == 16000
+        np.testing.assert_array_equal(audio, samples / 8388608.0)
+    
+    @pytest.mark.parametrize("chunk_bytes", [1 << 20, 8])
+    def test_load_audio_stereo_downmix(self, monkeypatch, chunk_bytes):
+        """Test that multi-channel WAV files are averaged to mono."""
+        import wave
+        
+        # A tiny chunk size makes decoding cross chunk boundaries
+        monkeypatch.setattr(utils, "_DECODE_CHUNK_BYTES", chunk_bytes)
+        frames = np.array([[1000, 3000], [-32768, 32767], [0, -2]], dtype='<i2')
+        
+        with tempfile.TemporaryDirectory() as temp_dir:
+            wav_path = Path(temp_dir) / "stereo.wav"
+            with wave.open(str(wav_path), "wb") as wav_file:
+                wav_file.setnchannels(2)
+                wav_file.setsampwidth(2)
+                wav_file.setframerate(48000)
+                wav_file.writeframes(frames.tobytes())
+            
+            audio, sample_rate = load_audio(wav_path)
+        
+        assert sample_rate == 48000
+        assert audio.dtype == np.float32
+        np.testing.assert_allclose(audio, frames.mean(axis=1) / 32768.0, rtol=1e-6)
+    
+    @pytest.mark.parametrize("dtype, n_channels", [('<f4', 1), ('<f4', 2), ('<f8', 1)])
+    def test_load_audio_ieee_float(self, tmp_path, dtype, n_channels):
+        """Test loading IEEE float WAV files into arrays that own their data."""
+        import struct
+        
+        frames = np.array([[0.5, -0.25], [-1.0, 1.0], [0.125, 0.0]], dtype=dtype)[:, :n_channels]
+        payload = frames.tobytes()
+        block_align = frames.itemsize * n_channels
+        wav_path = tmp_path / "float.wav"
+        wav_path.write_bytes(struct.pack(
+            '<4sI4s4sIHHIIHH4sI',
+            b'RIFF', 36 + len(payload), b'WAVE',
+            b'fmt ', 16, 3, n_channels, 16000, 16000 * block_align, block_align, frames.itemsize * 8,
+            b'data', len(payload)
+        ) + payload)
+        
+        audio, sample_rate = load_audio(wav_path)
+        
+        assert sample_rate == 16000
+        assert audio.dtype == np.float32
+        np.testing.assert_array_equal(audio, frames.mean(axis=1, dtype=np.float64).astype(np.float32))
+        
+        # Rewriting (and truncating) the file must not reach the loaded array
+        expected = audio.copy()
+        save_audio(np.zeros(1, dtype=np.float32), wav_path, 16000)
+        np.testing.assert_array_equal(audio, expected)
+    
+    @pytest.mark.parametrize("orig_sr, target_sr", [(48000, 16000), (16000, 48000), (44100, 16000)])
+    def test_resample_audio(self, orig_sr, target_sr, tone):
+        """Test resampling keeps length, dtype and in-band content."""
+        signal = tone(orig_sr, 0.5, 1000)
+        
+        resampled = resample_audio(signal, orig_sr, target_sr)
+        expected = tone(target_sr, 0.5, 1000)
+        
+        assert resampled.dtype == np.float32
+        assert abs(len(resampled) - len(signal) * target_sr / orig_sr) <= 1
+        # Compare away from the edges, where the FIR filter ramps in/out
+        n = min(len(resampled), len(expected))
+        np.testing.assert_allclose(resampled[100:n - 100], expected[100:n - 100], atol=1e-2)
+    
+    @pytest.mark.parametrize("orig_sr, target_sr", [(48000, 16000), (16000, 44100), (8000, 8001)])
+    def test_resample_linear_matches_interp(self, orig_sr, target_sr, tone, noise):
+        """Test the linear fallback against np.interp on the same grid."""
+        signal = tone(orig_sr, 0.1, 1000) + noise(orig_sr // 10, 0.1)
+        new_length = int(len(signal) * target_sr / orig_sr)
+        expected = np.interp(
+            np.linspace(0, len(signal) - 1, new_length), np.arange(len(signal)), signal
+        )
+        
+        resampled = utils._resample_linear(signal, orig_sr, target_sr)
+        
+        np.testing.assert_allclose(resampled, expected, rtol=1e-6, atol=1e-6)
+    
+    @pytest.mark.parametrize("content, expected", [
+        ("reference,degraded\nref1.wav,deg1.wav\n\nref2.wav, deg2.wav\n",
+         [("ref1.wav", "deg1.wav"), ("ref2.wav", "deg2.wav")]),
+        ("degraded,label,reference\r\ndeg1.wav,a,ref1.wav\r\n,b,ref2.wav\r\n",
+         [("ref1.wav", "deg1.wav")]),
+        ('reference,degraded\n"my, ref.wav",deg1.wav\n',
+         [("my, ref.wav", "deg1.wav")]),
+        ("", []),
+    ])
+    def test_load_batch_csv(self, tmp_path, content, expected):
+        """Test batch CSV parsing for plain, reordered and quoted files."""
+        csv_path = tmp_path / "batch.csv"
+        csv_path.write_bytes(content.encode("utf-8"))
+        
+        assert load_batch_csv(csv_path) == expected
+    
+    def test_save_audio_rounds_and_sanitizes(self, tmp_path):
+        """Test that saving rounds to nearest and maps NaN/Inf into range."""
+        audio = np.array([0.9 / 32767, -0.9 / 32767, np.nan, np.inf, -np.inf, 2.0], dtype=np.float64)
+        wav_path = tmp_path / "rounded.wav"
+        
+        save_audio(audio, wav_path, 16000)
+        pcm = np.frombuffer(wav_path.read_bytes()[44:], dtype='<i2')
+        
+        np.testing.assert_array_equal(pcm, [1, -1, 0, 32767, -32768, 32767])
+    
+    def test_validate_audio_files(self, tmp_path, tone):
+        """Test that only existing, non-empty WAV files pass validation."""
+        valid = str(tmp_path / "valid.wav")
+        empty = str(tmp_path / "empty.wav")
+        not_wav = str(tmp_path / "not_wav.wav")
+        missing = str(tmp_path / "missing.wav")
+        
+        save_audio(tone(16000, 0.1, 440), valid, 16000)
+        save_audio(np.zeros(0, dtype=np.float32), empty, 16000)
+        Path(not_wav).write_bytes(b"not a wav file")
+        
+        assert validate_audio_files([valid, empty, not_wav, missing, valid]) == [valid, valid]
+    
+    def test_validate_audio_files_uses_header_cache(self, tmp_path, monkeypatch, tone):
+        """Test that unchanged files are validated from the header cache."""
+        cache_file = tmp_path / "headers.json"
+        path = str(tmp_path / "cached.wav")
+        gone = str(tmp_path / "gone.wav")
+        save_audio(tone(16000, 0.1, 440), path, 16000)
+        save_audio(tone(16000, 0.1, 440), gone, 16000)
+        assert validate_audio_files([path, gone], header_cache=cache_file) == [path, gone]
+        
+        # Entries are pruned when their file is found missing
+        Path(gone).unlink()
+        validate_audio_files([path, gone], header_cache=cache_file)
+        assert list(json.loads(cache_file.read_text())) == [path]
+        
+        def _fail(file_path):
+            raise AssertionError("header should come from the cache")
+        
+        monkeypatch.setattr(utils, "_peek_wav_header", _fail)
+        assert validate_audio_files([path], header_cache=cache_file) == [path]
+        
+        # Rewriting the file changes its size, so the entry is stale
+        save_audio(tone(16000, 0.2, 440), path, 16000)
+        assert validate_audio_files([path], header_cache=cache_file) == []
+    
+    def test_compute_audio_stats(self):
+        """Test statistics of a known signal."""
+        audio = np.array([0.5, -1.0, 0.25, -0.25], dtype=np.float32)
+        
+        stats = compute_audio_stats(audio, 4)
+        
+        assert stats['duration'] == 1.0
+        assert stats['num_samples'] == 4
+        assert stats['rms'] == pytest.approx(np.sqrt(np.mean(audio.astype(np.float64) ** 2)))
+        assert stats['max_amplitude'] == 1.0
+        assert stats['mean_amplitude'] == pytest.approx(0.5)
+    
+    def test_compute_audio_stats_batch(self, tmp_path, tone):
+        """Test batch statistics match per-file statistics, in order."""
+        paths = []
+        for i, freq in enumerate([220, 440, 880]):
+            path = tmp_path / f"tone_{i}.wav"
+            save_audio(tone(16000, 0.1 * (i + 1), freq, amp=0.5), path, 16000)
+            paths.append(path)
+        
+        stats = compute_audio_stats_batch(paths)
+        
+        assert [s['num_samples'] for s in stats] == [1600, 3200, 4800]
+        for path, batch_stats in zip(paths, stats):
+            assert batch_stats == compute_audio_stats(*load_audio(path))
+    
+    def test_save_results_csv(self):
+        """Test saving results as CSV."""
+        results = [
+            ViSQOLResult(moslqo=3.5, vnsim=0.8, reference_path="ref.wav", degraded_path="deg.wav"),
+            ViSQOLResult(moslqo=4.25, vnsim=0.9),
+        ]
+        
+        with tempfile.TemporaryDirectory() as temp_dir:
+            csv_path = Path(temp_dir) / "results.csv"
+            save_results(results, csv_path)
+            content = csv_path.read_bytes()
+        
+        # Same bytes as csv.writer's default dialect, CRLF line endings included
+        assert content == (
+            b"reference,degraded,moslqo,vnsim\r\n"
+            b"ref.wav,deg.wav,3.500000,0.800000\r\n"
+            b",,4.250000,0.900000\r\n"
+        )
+    
+    def test_save_results_json(self):
+        """Test saving results as JSON, including array-valued fields."""
+        results = [
+            ViSQOLResult(
+                moslqo=3.5, vnsim=0.8, fvnsim=np.array([0.5, 0.75]),
+                center_freq_bands=[50.0, 100.0], reference_path="ref.wav", degraded_path="deg.wav"
+            ),
+        ]
+        
+        with tempfile.TemporaryDirectory() as temp_dir:
+            json_path = Path(temp_dir) / "results.json"
+            save_results(results, json_path, format='json')
+            data = json.loads(json_path.read_text())
+        
+        assert data == [{
+            'reference_path': "ref.wav",
+            'degraded_path': "deg.wav",
+            'moslqo': 3.5,
+            'vnsim': 0.8,
+            'fvnsim': [0.5, 0.75],
+            'center_freq_bands': [50.0, 100.0],
+        }]
+    
+    def test_save_results_csv_quoted_paths(self):
+        """Test that paths containing commas or quotes survive a round trip."""
+        results = [
+            ViSQOLResult(moslqo=3.5, vnsim=0.8, reference_path='my, "ref".wav', degraded_path="deg.wav"),
+        ]
+        
+        with tempfile.TemporaryDirectory() as temp_dir:
+            csv_path = Path(temp_dir) / "results.csv"
+            save_results(results, csv_path)
+            
+            assert load_batch_csv(csv_path) == [('my, "ref".wav', "deg.wav")]
+
+
 class TestViSQOLModes:
     """Test cases for ViSQOL modes."""
     
@@ -169,27 +517,17 @@ class TestViSQOLModes:
         assert ViSQOLMode.AUDIO.value == "audio"
         assert ViSQOLMode.SPEECH.value == "speech"
     
-    def test_mode_comparison(self):
+    def test_mode_comparison(self, visqol_audio, visqol_speech, tone_48k):
         """Test comparing results from different modes."""
-        # Create test signal suitable for both modes
-        sample_rate_audio = 48000
-        sample_rate_speech = 16000
-        duration = 2.0
-        
         # Audio mode signal
-        t_audio = np.linspace(0, duration, int(sample_rate_audio * duration))
-        ref_audio = np.sin(2 * np.pi * 440 * t_audio)
-        deg_audio = ref_audio + 0.05 * np.random.randn(len(ref_audio))
+        ref_audio, deg_audio = tone_48k
         
-        # Speech mode signal (downsampled)
+        # Speech mode signal (downsampled to 16kHz)
         from scipy import signal
-        ref_speech = signal.resample(ref_audio, int(sample_rate_speech * duration))
-        deg_speech = signal.resample(deg_audio, int(sample_rate_speech * duration))
+        ref_speech = signal.resample_poly(ref_audio, 1, 3)
+        deg_speech = signal.resample_poly(deg_audio, 1, 3)
         
         # Test both modes
-        visqol_audio = ViSQOL(mode=ViSQOLMode.AUDIO)
-        visqol_speech = ViSQOL(mode=ViSQOLMode.SPEECH)
-        
         result_audio = visqol_audio.measure(ref_audio, deg_audio)
         result_speech = visqol_speech.measure(ref_speech, deg_speech)
         
@@ -1,16 +1,27 @@
 """Utility functions for ViSQOL-Py."""
 
+import json
+import math
 import os
-import csv
 from pathlib import Path
 from typing import List, Tuple, Union, Optional
 
 import numpy as np
 
+import mmap
 import struct
-import wave
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
 
-from .visqol import ViSQOLResult
+from .visqol import ViSQOLResult, _CSV_LINE_END, _csv_escape
+
+
+# Format tags from the WAVE fmt chunk
+_WAVE_FORMAT_PCM = 0x0001
+_WAVE_FORMAT_IEEE_FLOAT = 0x0003
+
+# Most entries kept in a validate_audio_files header cache file
+_HEADER_CACHE_MAX_ENTRIES = 10000
 
 
 def load_audio(
@@ -19,7 +30,7 @@ def load_audio(
     mono: bool = True
 ) -> Tuple[np.ndarray, int]:
     """
-    Load WAV audio file using Python's built-in wave module.
+    Load WAV audio file, memory-mapping its PCM payload.
     
     Args:
         file_path: Path to WAV file
@@ -29,7 +40,7 @@ def load_audio(
     Returns:
         Tuple of (audio_data, sample_rate)
     """
-    audio_data, orig_sr = _load_wav_file(str(file_path))
+    audio_data, orig_sr = _load_wav_file(os.fspath(file_path))
     
     # Resample if needed
     if sample_rate is not None and orig_sr != sample_rate:
@@ -52,7 +63,7 @@ def save_audio(
         file_path: Output WAV file path  
         sample_rate: Sample rate
     """
-    _save_wav_file(audio_data, str(file_path), sample_rate)
+    _save_wav_file(audio_data, os.fspath(file_path), sample_rate)
 
 
 def load_batch_csv(csv_path: Union[str, Path]) -> List[Tuple[str, str]]:
@@ -70,13 +81,81 @@ def load_batch_csv(csv_path: Union[str, Path]) -> List[Tuple[str, str]]:
     Returns:
         List of (reference_path, degraded_path) tuples
     """
+    with open(csv_path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return []
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            # Quoted fields need a real CSV parser
+            if mm.find(b'"') != -1:
+                return _load_batch_csv_quoted(csv_path)
+            return _scan_batch_csv(mm)
+
+
+def _scan_batch_csv(mm: mmap.mmap) -> List[Tuple[str, str]]:
+    """
+    Extract (reference, degraded) pairs from an unquoted, mapped CSV file.
+    
+    Args:
+        mm: Memory-mapped CSV file contents
+        
+    Returns:
+        List of (reference_path, degraded_path) tuples
+    """
+    size = len(mm)
+    end = mm.find(b'\n')
+    if end == -1:
+        end = size
+    header = [name.strip() for name in mm[:end].decode('utf-8-sig').split(',')]
+    if 'reference' not in header or 'degraded' not in header:
+        return []
+    ref_col = header.index('reference')
+    deg_col = header.index('degraded')
+    # The usual "reference,degraded[,...]" layout only needs two finds per row
+    leading_pair = (ref_col, deg_col) == (0, 1)
+    
+    file_pairs = []
+    pos = end + 1
+    while pos < size:
+        end = mm.find(b'\n', pos)
+        if end == -1:
+            end = size
+        line = mm[pos:end]
+        pos = end + 1
+        
+        if leading_pair:
+            comma = line.find(b',')
+            if comma == -1:
+                continue
+            next_comma = line.find(b',', comma + 1)
+            ref_field = line[:comma]
+            deg_field = line[comma + 1:] if next_comma == -1 else line[comma + 1:next_comma]
+        else:
+            fields = line.split(b',')
+            if len(fields) <= max(ref_col, deg_col):
+                continue
+            ref_field = fields[ref_col]
+            deg_field = fields[deg_col]
+        
+        ref_path = ref_field.decode('utf-8').strip()
+        deg_path = deg_field.decode('utf-8').strip()
+        
+        if ref_path and deg_path:
+            file_pairs.append((ref_path, deg_path))
+    
+    return file_pairs
+
+
+def _load_batch_csv_quoted(csv_path: Union[str, Path]) -> List[Tuple[str, str]]:
+    """Load a batch CSV file that uses quoted fields."""
     file_pairs = []
     
-    with open(csv_path, 'r') as csvfile:
+    import csv
+    
+    with open(csv_path, 'r', encoding='utf-8-sig', newline='') as csvfile:
         reader = csv.DictReader(csvfile)
         for row in reader:
-            ref_path = row.get('reference', '').strip()
-            deg_path = row.get('degraded', '').strip()
+            ref_path = (row.get('reference') or '').strip()
+            deg_path = (row.get('degraded') or '').strip()
             
             if ref_path and deg_path:
                 file_pairs.append((ref_path, deg_path))
@@ -107,78 +186,135 @@ def save_results(
 
 def _save_results_csv(results: List[ViSQOLResult], output_path: Union[str, Path]) -> None:
     """Save results as CSV."""
-    with open(output_path, 'w', newline='') as csvfile:
-        writer = csv.writer(csvfile)
-        
-        # Header
-        writer.writerow(['reference', 'degraded', 'moslqo', 'vnsim'])
-        
-        # Data
-        for result in results:
-            writer.writerow([
-                result.reference_path or '',
-                result.degraded_path or '',
-                f"{result.moslqo:.6f}",
-                f"{result.vnsim:.6f}"
-            ])
+    # Format the whole file in memory, then write it out in a single call;
+    # paths with delimiters, quotes or line breaks are quoted (RFC 4180)
+    lines = ["reference,degraded,moslqo,vnsim"]
+    lines.extend(
+        f"{_csv_escape(result.reference_path or '')},"
+        f"{_csv_escape(result.degraded_path or '')},"
+        f"{result.moslqo:.6f},{result.vnsim:.6f}"
+        for result in results
+    )
+    lines.append('')
+    content = _CSV_LINE_END.join(lines)
+    
+    with open(output_path, 'w', newline='', buffering=1 << 20) as csvfile:
+        csvfile.write(content)
 
 
 def _save_results_json(results: List[ViSQOLResult], output_path: Union[str, Path]) -> None:
     """Save results as JSON."""
-    import json
-    
-    results_data = []
-    for result in results:
-        results_data.append({
+    results_data = [
+        {
             'reference_path': result.reference_path,
             'degraded_path': result.degraded_path,
             'moslqo': result.moslqo,
             'vnsim': result.vnsim,
             'fvnsim': result.fvnsim,
             'center_freq_bands': result.center_freq_bands,
-        })
+        }
+        for result in results
+    ]
+    
+    try:
+        import orjson
+    except ImportError:
+        with open(output_path, 'w') as jsonfile:
+            json.dump(results_data, jsonfile, indent=2, default=_json_default)
+        return
     
-    with open(output_path, 'w') as jsonfile:
-        json.dump(results_data, jsonfile, indent=2)
+    with open(output_path, 'wb') as jsonfile:
+        jsonfile.write(orjson.dumps(
+            results_data,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY
+        ))
 
 
-def validate_audio_files(file_paths: List[str]) -> List[str]:
+def _json_default(value):
+    """Convert NumPy arrays and scalars for the stdlib JSON encoder."""
+    if isinstance(value, (np.ndarray, np.generic)):
+        return value.tolist()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def validate_audio_files(
+    file_paths: List[str],
+    header_cache: Optional[Union[str, Path]] = None
+) -> List[str]:
     """
     Validate that audio files exist and are readable.
     
+    Files are checked concurrently; warnings are reported in input order.
+    
     Args:
         file_paths: List of file paths to validate
+        header_cache: Optional JSON file that keeps parsed WAV headers
+            between calls, so files whose modification time and size are
+            unchanged are not reopened. Entries for files found missing
+            are dropped and only the most recently used are kept. None
+            (default) reads every header and writes nothing
         
     Returns:
         List of valid file paths
     """
-    valid_paths = []
+    if not file_paths:
+        return []
+    
+    cache = _load_header_cache(header_cache) if header_cache is not None else None
+    
+    # Header checks are I/O-bound, so threads overlap the disk latency
+    with ThreadPoolExecutor(max_workers=_io_workers(len(file_paths))) as executor:
+        warnings = list(executor.map(partial(_check_audio_file, cache=cache), map(os.fspath, file_paths)))
     
-    for file_path in file_paths:
-        if os.path.isfile(file_path):
-            try:
-                # Try to read WAV file info to validate format
-                with wave.open(file_path, 'rb') as wav_file:
-                    frames = wav_file.getnframes()
-                    if frames > 0:  # Valid WAV file
-                        valid_paths.append(file_path)
-                    else:
-                        print(f"Warning: Empty WAV file: {file_path}")
-            except Exception as e:
-                print(f"Warning: Could not load WAV file {file_path}: {e}")
+    if cache is not None:
+        _save_header_cache(header_cache, cache)
+    
+    valid_paths = []
+    for file_path, warning in zip(file_paths, warnings):
+        if warning is None:
+            valid_paths.append(file_path)
         else:
-            print(f"Warning: File not found: {file_path}")
+            print(warning)
     
     return valid_paths
 
 
+def _check_audio_file(file_path: str, cache: Optional[dict] = None) -> Optional[str]:
+    """Return a warning message if the file is not a usable WAV file."""
+    if not os.path.isfile(file_path):
+        if cache is not None:
+            # Prune lazily, only for paths this call looked at
+            cache.pop(os.path.abspath(file_path), None)
+        return f"Warning: File not found: {file_path}"
+    
+    try:
+        # Parse only the RIFF header to validate format
+        if cache is None:
+            frames, _ = _peek_wav_header(file_path)
+        else:
+            frames, _ = _peek_wav_header_cached(file_path, cache)
+    except Exception as e:
+        return f"Warning: Could not load WAV file {file_path}: {e}"
+    
+    if frames <= 0:
+        return f"Warning: Empty WAV file: {file_path}"
+    return None
+
+
+def _io_workers(n_tasks: int) -> int:
+    """Number of threads to use for I/O-bound work over n_tasks items."""
+    return max(1, min(n_tasks, 32, (os.cpu_count() or 1) * 4))
+
+
 def resample_audio(
     audio_data: np.ndarray,
     orig_sr: int,
     target_sr: int
 ) -> np.ndarray:
     """
-    Resample audio data using linear interpolation.
+    Resample audio data using a polyphase anti-aliasing FIR filter.
+    
+    Falls back to linear interpolation when SciPy is not available.
     
     Args:
         audio_data: Input audio data
@@ -191,19 +327,113 @@ def resample_audio(
     if orig_sr == target_sr:
         return audio_data
     
+    try:
+        from scipy.signal import upfirdn
+    except ImportError:
+        return _resample_linear(audio_data, orig_sr, target_sr)
+    
+    # Reduce the rate ratio to the smallest integer up/down factors,
+    # e.g. 48000 -> 16000 becomes a plain decimation by 3
+    g = math.gcd(int(orig_sr), int(target_sr))
+    up, down = int(target_sr) // g, int(orig_sr) // g
+    
+    # Same result as scipy.signal.resample_poly, but with the padded
+    # filter designed once per rate pair instead of on every call. Taps
+    # match the input precision, so float32 audio is filtered in float32
+    filter_dtype = audio_data.dtype if audio_data.dtype in (np.float32, np.float64) else np.float64
+    taps, n_pre_remove = _resample_filter(up, down, np.dtype(filter_dtype))
+    n_out = -(-len(audio_data) * up // down)
+    filtered = upfirdn(taps, audio_data, up, down, axis=0)
+    resampled = filtered[n_pre_remove:n_pre_remove + n_out]
+    if len(resampled) < n_out:
+        # The filter's zero tail would only have produced zeros here
+        padding = np.zeros((n_out - len(resampled),) + resampled.shape[1:], dtype=resampled.dtype)
+        resampled = np.concatenate((resampled, padding))
+    
+    if audio_data.dtype.kind == 'f':
+        resampled = resampled.astype(audio_data.dtype, copy=False)
+    return resampled
+
+
+@lru_cache(maxsize=64)
+def _resample_filter(up: int, down: int, dtype: np.dtype = np.dtype(np.float64)) -> Tuple[np.ndarray, int]:
+    """
+    Design the anti-aliasing FIR filter for polyphase resampling.
+    
+    Matches resample_poly's own default design (Kaiser window, beta 5.0,
+    10 zero crossings per side), but is computed once per rate pair.
+    
+    Args:
+        up: Upsampling factor
+        down: Downsampling factor
+        dtype: Floating-point type of the taps
+        
+    Returns:
+        Tuple of (taps, n_pre_remove): read-only filter taps, scaled by
+        up and zero-padded in front so that output sample 0 of upfirdn
+        lands at index n_pre_remove
+    """
+    from scipy.signal import firwin
+    
+    max_rate = max(up, down)
+    half_len = 10 * max_rate
+    taps = firwin(2 * half_len + 1, 1.0 / max_rate, window=('kaiser', 5.0))
+    taps *= up
+    
+    # Pad so that the filter's center falls on an output sample
+    n_pre_pad = down - half_len % down
+    taps = np.concatenate((np.zeros(n_pre_pad), taps)).astype(dtype, copy=False)
+    
+    # Shared between calls, so guard against accidental mutation
+    taps.flags.writeable = False
+    return taps, (half_len + n_pre_pad) // down
+
+
+def _resample_linear(
+    audio_data: np.ndarray,
+    orig_sr: int,
+    target_sr: int
+) -> np.ndarray:
+    """
+    Resample audio data using linear interpolation.
+    
+    Args:
+        audio_data: Input audio data
+        orig_sr: Original sample rate
+        target_sr: Target sample rate
+        
+    Returns:
+        Resampled audio data
+    """
     # Calculate resampling ratio
     ratio = target_sr / orig_sr
     
-    # Create new time indices
     orig_length = len(audio_data)
     new_length = int(orig_length * ratio)
     
-    # Linear interpolation
-    orig_indices = np.linspace(0, orig_length - 1, orig_length)
-    new_indices = np.linspace(0, orig_length - 1, new_length)
+    # Output samples sit at evenly spaced positions over the input, so
+    # the neighbouring input samples follow directly from each position;
+    # no index grid or np.interp's per-sample binary search is needed
+    step = (orig_length - 1) / (new_length - 1) if new_length > 1 else 0.0
+    positions = np.arange(new_length, dtype=np.float64)
+    positions *= step
+    lower = positions.astype(np.intp)
+    # positions becomes the fractional offset in place
+    positions -= lower
+    frac = positions
+    if audio_data.dtype == np.float32:
+        # Positions need float64 precision, but the blend stays in float32
+        frac = positions.astype(np.float32)
+    upper = lower + 1
+    np.minimum(upper, orig_length - 1, out=upper)
     
-    # Interpolate
-    resampled = np.interp(new_indices, orig_indices, audio_data)
+    # Interpolate into the gathered upper samples, updating them in place
+    # rather than allocating a temporary for every arithmetic step
+    lower_values = audio_data[lower]
+    resampled = audio_data[upper].astype(np.result_type(audio_data.dtype, frac.dtype), copy=False)
+    resampled -= lower_values
+    resampled *= frac
+    resampled += lower_values
     
     return resampled
 
@@ -219,19 +449,320 @@ def compute_audio_stats(audio_data: np.ndarray, sample_rate: int) -> dict:
     Returns:
         Dictionary with audio statistics
     """
+    samples = np.ravel(audio_data)
+    n = len(samples)
+    
+    # Sum of squares as a single dot product, and peak from max/min,
+    # so only the mean amplitude needs an np.abs temporary
+    sum_squares = float(np.dot(samples, samples))
+    max_amplitude = max(float(samples.max()), -float(samples.min()))
+    
     return {
         'duration': len(audio_data) / sample_rate,
         'sample_rate': sample_rate,
         'num_samples': len(audio_data),
-        'rms': np.sqrt(np.mean(audio_data**2)),
-        'max_amplitude': np.max(np.abs(audio_data)),
-        'mean_amplitude': np.mean(np.abs(audio_data)),
+        'rms': math.sqrt(sum_squares / n),
+        'max_amplitude': max_amplitude,
+        'mean_amplitude': float(np.abs(samples).mean()),
     }
 
 
+def compute_audio_stats_batch(file_paths: List[Union[str, Path]]) -> List[dict]:
+    """
+    Load audio files and compute their statistics concurrently.
+    
+    Args:
+        file_paths: List of WAV file paths
+        
+    Returns:
+        List of statistics dictionaries, in the order of file_paths
+    """
+    if not file_paths:
+        return []
+    
+    def _stats(file_path):
+        audio_data, sample_rate = load_audio(file_path)
+        return compute_audio_stats(audio_data, sample_rate)
+    
+    # Decoding and NumPy reductions release the GIL, so threads scale here
+    with ThreadPoolExecutor(max_workers=_io_workers(len(file_paths))) as executor:
+        return list(executor.map(_stats, file_paths))
+
+
+def _read_wav_header(wav_file) -> Tuple[int, int, int, int, int, int]:
+    """
+    Parse the RIFF header of an open WAV file.
+    
+    Walks the chunk list up to the data chunk without reading the payload.
+    
+    Args:
+        wav_file: WAV file opened in binary mode
+        
+    Returns:
+        Tuple of (n_channels, sample_width, sample_rate, data_offset, data_size,
+        format_tag), where format_tag is PCM (1) or IEEE float (3)
+    """
+    riff_header = wav_file.read(12)
+    if len(riff_header) < 12 or riff_header[:4] != b'RIFF' or riff_header[8:12] != b'WAVE':
+        raise ValueError("Not a RIFF/WAVE file")
+    
+    fmt_chunk = None
+    while True:
+        chunk_header = wav_file.read(8)
+        if len(chunk_header) < 8:
+            raise ValueError("No data chunk found")
+        chunk_id, chunk_size = struct.unpack('<4sI', chunk_header)
+        
+        if chunk_id == b'fmt ':
+            fmt_chunk = wav_file.read(chunk_size)
+            if len(fmt_chunk) < 16:
+                raise ValueError("Truncated fmt chunk")
+            wav_file.seek(chunk_size & 1, 1)  # Chunks are padded to even sizes
+        elif chunk_id == b'data':
+            break
+        else:
+            wav_file.seek(chunk_size + (chunk_size & 1), 1)
+    
+    if fmt_chunk is None:
+        raise ValueError("No fmt chunk before data chunk")
+    
+    format_tag, n_channels, sample_rate, _, block_align, _ = struct.unpack_from('<HHIIHH', fmt_chunk)
+    if format_tag == 0xFFFE and len(fmt_chunk) >= 26:  # WAVE_FORMAT_EXTENSIBLE
+        format_tag = struct.unpack_from('<H', fmt_chunk, 24)[0]
+    if format_tag not in (_WAVE_FORMAT_PCM, _WAVE_FORMAT_IEEE_FLOAT):
+        raise ValueError(f"Unsupported WAV format tag: {format_tag} (only PCM and IEEE float are supported)")
+    if n_channels == 0:
+        raise ValueError("WAV file has no channels")
+    
+    return n_channels, block_align // n_channels, sample_rate, wav_file.tell(), chunk_size, format_tag
+
+
+def _peek_wav_header(file_path: str) -> Tuple[int, int]:
+    """
+    Read the frame count and sample rate of a WAV file from its header.
+    
+    Args:
+        file_path: Path to WAV file
+        
+    Returns:
+        Tuple of (n_frames, sample_rate)
+    """
+    # A small buffer is enough: only the chunk headers are ever read
+    with open(file_path, 'rb', buffering=4096) as f:
+        n_channels, sample_width, sample_rate, data_offset, data_size, _ = _read_wav_header(f)
+        data_size = min(data_size, os.fstat(f.fileno()).st_size - data_offset)
+    
+    return max(data_size, 0) // (sample_width * n_channels), sample_rate
+
+
+def _peek_wav_header_cached(file_path: str, cache: dict) -> Tuple[int, int]:
+    """
+    Like _peek_wav_header, but served from cache when the file's
+    modification time and size are unchanged.
+    
+    Args:
+        file_path: Path to WAV file
+        cache: Header cache from _load_header_cache, keyed by absolute
+            path and holding (mtime_ns, size, n_frames, sample_rate);
+            used entries move to the end, so it stays in LRU order
+        
+    Returns:
+        Tuple of (n_frames, sample_rate)
+    """
+    st = os.stat(file_path)
+    key = os.path.abspath(file_path)
+    
+    entry = cache.pop(key, None)
+    if entry is None or entry[0] != st.st_mtime_ns or entry[1] != st.st_size:
+        entry = (st.st_mtime_ns, st.st_size) + _peek_wav_header(file_path)
+    cache[key] = entry
+    return entry[2], entry[3]
+
+
+def _load_header_cache(cache_file: Union[str, Path]) -> dict:
+    """Read a header cache file, treating a missing or corrupt one as empty."""
+    try:
+        with open(cache_file, 'r') as f:
+            return {key: tuple(entry) for key, entry in json.load(f).items()}
+    except (OSError, ValueError, TypeError, AttributeError):
+        return {}
+
+
+def _save_header_cache(cache_file: Union[str, Path], cache: dict) -> None:
+    """Atomically write the most recently used cache entries."""
+    keys = list(cache)[-_HEADER_CACHE_MAX_ENTRIES:]
+    cache_file = Path(cache_file)
+    tmp_path = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.tmp")
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        with open(tmp_path, 'w') as f:
+            json.dump({key: cache[key] for key in keys}, f)
+        os.replace(tmp_path, cache_file)
+    except OSError:
+        # The cache is only an optimization; never fail validation
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+
+
+def _load_wav_mmap(file_path: str) -> Tuple[np.ndarray, int, int, int, int]:
+    """
+    Memory-map the sample payload of a WAV file.
+    
+    The mapping is read-only; decoders copy samples out of it into new
+    arrays, so no caller ever holds a view of the file.
+    
+    Args:
+        file_path: Path to WAV file
+        
+    Returns:
+        Tuple of (payload, n_channels, sample_width, sample_rate, format_tag),
+        where payload is a uint8 view of the data chunk that keeps the
+        mapping alive
+    """
+    with open(file_path, 'rb') as f:
+        n_channels, sample_width, sample_rate, data_offset, data_size, format_tag = _read_wav_header(f)
+        
+        # Clamp to the bytes actually present (truncated or streamed files)
+        data_size = min(data_size, os.fstat(f.fileno()).st_size - data_offset)
+        data_size -= data_size % (sample_width * n_channels)
+        
+        if data_size <= 0:
+            return np.empty(0, dtype=np.uint8), n_channels, sample_width, sample_rate, format_tag
+        
+        mapping = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    
+    payload = np.frombuffer(mapping, dtype=np.uint8, count=data_size, offset=data_offset)
+    return payload, n_channels, sample_width, sample_rate, format_tag
+
+
+def _to_float32(samples: np.ndarray, scale: float, out: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Convert PCM samples to scaled float32 in a single ufunc pass.
+    
+    Args:
+        samples: Integer or floating-point sample array
+        scale: Factor mapping full-scale integers to [-1, 1)
+        out: Optional float32 array to write into
+        
+    Returns:
+        The float32 output array
+    """
+    if out is None:
+        out = np.empty(samples.shape, dtype=np.float32)
+    np.multiply(samples, np.float32(scale), out=out, casting='unsafe')
+    return out
+
+
+def _samples_u8(raw_audio: np.ndarray) -> np.ndarray:
+    """8-bit PCM is unsigned and already a uint8 view."""
+    return raw_audio
+
+
+def _samples_s16(raw_audio: np.ndarray) -> np.ndarray:
+    """View 16-bit PCM as little-endian int16."""
+    return np.frombuffer(raw_audio, dtype='<i2')
+
+
+def _samples_s24(raw_audio: np.ndarray) -> np.ndarray:
+    """Unpack 24-bit PCM into sign-extended int32."""
+    n_samples = len(raw_audio) // 3
+    samples = np.empty(n_samples, dtype=np.int32)
+    if n_samples == 0:
+        return samples
+    
+    # Overlapping little-endian int32 words with a 3-byte stride hold each
+    # sample in their low three bytes; shifting left then right by 8 drops
+    # the neighbouring byte and sign-extends, without copying the payload.
+    # The last word would read past the payload, so decode that one alone.
+    if n_samples > 1:
+        words = np.lib.stride_tricks.as_strided(
+            raw_audio[:4].view('<i4'), shape=(n_samples - 1,), strides=(3,)
+        )
+        head = samples[:-1]
+        np.left_shift(words, 8, out=head)
+        head >>= 8
+    samples[-1] = int.from_bytes(raw_audio[-3:].tobytes(), 'little', signed=True)
+    return samples
+
+
+def _samples_s32(raw_audio: np.ndarray) -> np.ndarray:
+    """View 32-bit PCM as little-endian int32."""
+    return np.frombuffer(raw_audio, dtype='<i4')
+
+
+def _samples_f32(raw_audio: np.ndarray) -> np.ndarray:
+    """View 32-bit IEEE float samples as little-endian float32."""
+    return raw_audio.view('<f4')
+
+
+def _samples_f64(raw_audio: np.ndarray) -> np.ndarray:
+    """View 64-bit IEEE float samples as little-endian float64."""
+    return raw_audio.view('<f8')
+
+
+def _make_decoders(to_samples, scale: float, bias: int = 0):
+    """
+    Build the mono and multichannel decoders for one PCM sample format.
+    
+    Args:
+        to_samples: Function viewing the raw payload as integer samples
+        scale: Factor mapping full-scale integers to [-1, 1)
+        bias: Offset of the zero level (128 for unsigned 8-bit)
+        
+    Returns:
+        Tuple of (mono_decoder, multichannel_decoder), each taking the
+        raw payload, channel count and a float32 output array with one
+        element per frame, which receives the mono audio
+    """
+    offset = np.float32(bias * scale)
+    
+    def decode_mono(raw_audio, n_channels, out):
+        _to_float32(to_samples(raw_audio), scale, out=out)
+        if bias:
+            out -= offset
+    
+    def decode_multichannel(raw_audio, n_channels, out):
+        # Downmix and normalize in one pass over the interleaved samples,
+        # accumulating in float32 rather than np.mean's float64
+        samples = to_samples(raw_audio)
+        if n_channels == 2:
+            np.add(samples[0::2], samples[1::2], out=out, dtype=np.float32)
+        else:
+            samples.reshape(-1, n_channels).sum(axis=1, dtype=np.float32, out=out)
+        out *= np.float32(scale / n_channels)
+        if bias:
+            out -= offset
+    
+    return decode_mono, decode_multichannel
+
+
+# Amount of raw PCM decoded per step in _load_wav_file
+_DECODE_CHUNK_BYTES = 1 << 20
+
+# Decoders keyed by (format_tag, sample_width, 1 for mono or 2 for multichannel)
+_DECODERS = {}
+for _format_tag, _width, _to_samples, _scale, _bias in (
+    (_WAVE_FORMAT_PCM, 1, _samples_u8, 1.0 / 128.0, 128),
+    (_WAVE_FORMAT_PCM, 2, _samples_s16, 1.0 / 32768.0, 0),
+    (_WAVE_FORMAT_PCM, 3, _samples_s24, 1.0 / 8388608.0, 0),
+    (_WAVE_FORMAT_PCM, 4, _samples_s32, 1.0 / 2147483648.0, 0),
+    (_WAVE_FORMAT_IEEE_FLOAT, 4, _samples_f32, 1.0, 0),
+    (_WAVE_FORMAT_IEEE_FLOAT, 8, _samples_f64, 1.0, 0),
+):
+    _DECODERS[(_format_tag, _width, 1)], _DECODERS[(_format_tag, _width, 2)] = \
+        _make_decoders(_to_samples, _scale, _bias)
+del _format_tag, _width, _to_samples, _scale, _bias
+
+
 def _load_wav_file(file_path: str) -> Tuple[np.ndarray, int]:
     """
-    Load WAV file using Python's built-in wave module.
+    Load WAV file by memory-mapping its sample payload.
+    
+    Samples are decoded straight from the mapping, so the raw PCM data
+    is never copied into a Python bytes object first. The returned array
+    always owns its memory; it never refers to the mapped file.
     
     Args:
         file_path: Path to WAV file
@@ -240,48 +771,31 @@ def _load_wav_file(file_path: str) -> Tuple[np.ndarray, int]:
         Tuple of (audio_data, sample_rate)
     """
     try:
-        with wave.open(file_path, 'rb') as wav_file:
-            # Get WAV file parameters
-            n_channels = wav_file.getnchannels()
-            sample_width = wav_file.getsampwidth()
-            sample_rate = wav_file.getframerate()
-            n_frames = wav_file.getnframes()
-            
-            # Read raw audio data
-            raw_audio = wav_file.readframes(n_frames)
-            
-            # Convert to numpy array based on sample width
-            if sample_width == 1:  # 8-bit
-                audio_data = np.frombuffer(raw_audio, dtype=np.uint8)
-                audio_data = (audio_data.astype(np.float32) - 128) / 128.0
-            elif sample_width == 2:  # 16-bit
-                audio_data = np.frombuffer(raw_audio, dtype=np.int16)
-                audio_data = audio_data.astype(np.float32) / 32768.0
-            elif sample_width == 3:  # 24-bit
-                # Convert 24-bit to 32-bit integers
-                audio_bytes = np.frombuffer(raw_audio, dtype=np.uint8)
-                audio_data = []
-                for i in range(0, len(audio_bytes), 3):
-                    # Convert 3 bytes to 24-bit signed integer
-                    sample = int.from_bytes(audio_bytes[i:i+3], 'little', signed=True)
-                    audio_data.append(sample)
-                audio_data = np.array(audio_data, dtype=np.float32) / 8388608.0
-            elif sample_width == 4:  # 32-bit
-                audio_data = np.frombuffer(raw_audio, dtype=np.int32)
-                audio_data = audio_data.astype(np.float32) / 2147483648.0
-            else:
-                raise ValueError(f"Unsupported sample width: {sample_width} bytes")
-            
-            # Convert to mono if stereo
-            if n_channels == 2:
-                audio_data = audio_data.reshape(-1, 2)
-                audio_data = np.mean(audio_data, axis=1)
-            elif n_channels > 2:
-                audio_data = audio_data.reshape(-1, n_channels)
-                audio_data = np.mean(audio_data, axis=1)
-            
-            return audio_data, sample_rate
-            
+        # Map the PCM payload instead of copying it out with readframes
+        raw_audio, n_channels, sample_width, sample_rate, format_tag = _load_wav_mmap(file_path)
+        
+        # Mono float32 needs no decoding, only one copy out of the mapping;
+        # a view would change or fault if the file were rewritten later
+        if format_tag == _WAVE_FORMAT_IEEE_FLOAT and sample_width == 4 and n_channels == 1:
+            return np.array(_samples_f32(raw_audio)), sample_rate
+        
+        try:
+            decoder = _DECODERS[(format_tag, sample_width, min(n_channels, 2))]
+        except KeyError:
+            raise ValueError(f"Unsupported sample width: {sample_width} bytes") from None
+        
+        # Decode ~1 MiB of PCM at a time straight into the final array, so
+        # per-format temporaries stay bounded regardless of file length
+        frame_bytes = sample_width * n_channels
+        n_frames = len(raw_audio) // frame_bytes
+        chunk_frames = max(1, _DECODE_CHUNK_BYTES // frame_bytes)
+        audio_data = np.empty(n_frames, dtype=np.float32)
+        for start in range(0, n_frames, chunk_frames):
+            stop = min(start + chunk_frames, n_frames)
+            decoder(raw_audio[start * frame_bytes:stop * frame_bytes], n_channels, audio_data[start:stop])
+        
+        return audio_data, sample_rate
+        
     except Exception as e:
         raise RuntimeError(f"Failed to load WAV file {file_path}: {e}")
 
@@ -296,14 +810,28 @@ def _save_wav_file(audio_data: np.ndarray, file_path: str, sample_rate: int) ->
         sample_rate: Sample rate
     """
     try:
-        # Convert to 16-bit integers
-        audio_int16 = (audio_data * 32767).astype(np.int16)
+        # Convert to 16-bit integers, rounding to nearest rather than
+        # truncating toward zero, and clipping out-of-range samples
+        scaled = np.multiply(audio_data, 32767.0)
+        np.nan_to_num(scaled, copy=False)
+        np.rint(scaled, out=scaled)
+        np.clip(scaled, -32768, 32767, out=scaled)
+        audio_int16 = np.empty(scaled.shape, dtype='<i2')
+        np.copyto(audio_int16, scaled, casting='unsafe')
+        
+        # Canonical 44-byte header for mono 16-bit PCM
+        data_size = audio_int16.nbytes
+        header = struct.pack(
+            '<4sI4s4sIHHIIHH4sI',
+            b'RIFF', 36 + data_size, b'WAVE',
+            b'fmt ', 16, 1, 1, sample_rate, sample_rate * 2, 2, 16,
+            b'data', data_size
+        )
         
-        with wave.open(file_path, 'wb') as wav_file:
-            wav_file.setnchannels(1)  # Mono
-            wav_file.setsampwidth(2)  # 16-bit
-            wav_file.setframerate(sample_rate)
-            wav_file.writeframes(audio_int16.tobytes())
+        # Buffer the file so the header and payload go out in few writes
+        with open(file_path, 'wb', buffering=1 << 20) as f:
+            f.write(header)
+            f.write(memoryview(audio_int16))
             
     except Exception as e:
         raise RuntimeError(f"Failed to save WAV file {file_path}: {e}")
\ No newline at end of file
@@ -5,18 +5,24 @@ This module provides a Python interface to ViSQOL functionality
 using the native ViSQOL implementation. Native library build is required.
 """
 
+import hashlib
+import json
+import mmap
 import os
 import sys
+import tempfile
 import warnings
+from concurrent.futures import Future, ProcessPoolExecutor
+from contextlib import ExitStack
 from enum import Enum
 from dataclasses import dataclass, field
-from typing import List, Optional, Union, Dict, Any, Tuple
+from functools import lru_cache
+from typing import List, Optional, Union, Dict, Any, Iterable, Iterator, Tuple
 from pathlib import Path
 
 import numpy as np
 
 import struct
-import wave
 
 
 class ViSQOLMode(Enum):
@@ -25,7 +31,11 @@ class ViSQOLMode(Enum):
     SPEECH = "speech"  # 16kHz, speech with VAD
 
 
-@dataclass
+# Slotted dataclasses need Python 3.10+; older versions keep a __dict__
+_DATACLASS_SLOTS: Dict[str, bool] = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_DATACLASS_SLOTS)
 class ViSQOLResult:
     """ViSQOL computation results."""
     moslqo: float
@@ -40,6 +50,94 @@ class ViSQOLResult:
         return f"ViSQOLResult(MOS-LQO: {self.moslqo:.3f}, VNSIM: {self.vnsim:.3f})"
 
 
+@lru_cache(maxsize=1)
+def _resolve_native_modules() -> Optional[Tuple[Any, Any]]:
+    """
+    Locate the native ViSQOL library, once per process.
+    
+    Returns:
+        Tuple of (visqol_lib_py, visqol_config_pb2) modules, or None if
+        the native library is not available
+    """
+    try:
+        # Try to import the native ViSQOL library from our built package
+        import visqol_py.visqol_lib_py as visqol_lib_py
+        import visqol_py.pb2.visqol_config_py_pb2 as visqol_config_pb2
+        import visqol_py.pb2.similarity_result_py_pb2  # noqa: F401
+    except ImportError:
+        try:
+            # Fallback to system-wide installation
+            from visqol import visqol_lib_py
+            from visqol.pb2 import visqol_config_pb2
+        except ImportError:
+            return None
+    return visqol_lib_py, visqol_config_pb2
+
+
+# Most pairs sent to a measure_batch worker at once
+_BATCH_MAX_CHUNK_PAIRS = 8
+
+# Rows written to a measure_batch CSV between flushes
+_BATCH_CSV_FLUSH_ROWS = 64
+
+# Overlap between consecutive segments of a segmented measurement
+_SEGMENT_OVERLAP_SECONDS = 1.0
+
+# Shortest segment holding one native similarity patch: 30 frames of
+# the 80 ms analysis window, advanced in 20 ms hops (audio mode)
+_MIN_SEGMENT_SECONDS = 30 * 0.02 + 0.08
+
+
+def _segment_bounds(n_samples: int, segment_length: int, overlap: int) -> List[Tuple[int, int]]:
+    """
+    Split n_samples into overlapping [start, stop) segments.
+    
+    A trailing remainder shorter than half a segment is merged into the
+    last segment instead of being measured on its own.
+    
+    Args:
+        n_samples: Total number of samples
+        segment_length: Length of each segment in samples
+        overlap: Overlap between consecutive segments in samples
+        
+    Returns:
+        List of (start, stop) sample index pairs covering all samples
+        
+    Raises:
+        ValueError: If segment_length is less than one sample
+    """
+    if segment_length < 1:
+        raise ValueError(f"segment_length must be at least 1 sample, got {segment_length}")
+    overlap = max(0, min(overlap, segment_length // 2))
+    step = max(1, segment_length - overlap)
+    
+    bounds = []
+    start = 0
+    while start + segment_length < n_samples:
+        bounds.append((start, start + segment_length))
+        start += step
+    
+    if bounds and n_samples - start < segment_length // 2:
+        bounds[-1] = (bounds[-1][0], n_samples)
+    else:
+        bounds.append((start, n_samples))
+    return bounds
+
+
+@lru_cache(maxsize=32)
+def _target_sample_rate(mode: ViSQOLMode, original_sr: int) -> int:
+    """Target sample rate for a mode and original rate; see ViSQOL._get_target_sample_rate."""
+    if mode == ViSQOLMode.SPEECH:
+        # In speech mode, if original is already >= 16kHz, keep it
+        # This matches how original ViSQOL handles 48kHz files in speech mode
+        if original_sr >= 16000:
+            return original_sr
+        else:
+            return 16000
+    else:  # AUDIO mode
+        return 48000
+
+
 class ViSQOL:
     """
     ViSQOL Python wrapper class.
@@ -49,14 +147,43 @@ class ViSQOL:
     be built successfully for this package to function.
     """
     
-    def __init__(self, mode: ViSQOLMode = ViSQOLMode.AUDIO):
+    # Sample type of the native Measure binding, which takes absl::Span<double>
+    _preferred_dtype = np.float64
+    
+    def __init__(
+        self,
+        mode: ViSQOLMode = ViSQOLMode.AUDIO,
+        cache_dir: Optional[Union[str, Path]] = None,
+        max_segment_seconds: Optional[float] = None
+    ):
         """
         Initialize ViSQOL instance.
         
         Args:
             mode: Operating mode (AUDIO or SPEECH)
+            cache_dir: Optional directory in which results for file pairs
+                are cached, keyed by a hash of both files' contents and
+                the mode, so repeated measurements skip the native call
+            max_segment_seconds: Optional segment length for long inputs;
+                signals longer than this are measured in overlapping
+                segments whose scores are averaged, which keeps the
+                native similarity search cache-resident. None (default)
+                always measures the whole signal at once
+                
+        Raises:
+            ValueError: If max_segment_seconds is shorter than one native
+                similarity patch
+            ImportError: If the native ViSQOL library is not available
         """
+        if max_segment_seconds is not None and not max_segment_seconds >= _MIN_SEGMENT_SECONDS:
+            raise ValueError(
+                f"max_segment_seconds must be at least {_MIN_SEGMENT_SECONDS:.2f} "
+                f"(one similarity patch), got {max_segment_seconds!r}"
+            )
+        
         self.mode = mode
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else None
+        self.max_segment_seconds = max_segment_seconds
         self._native_available = self._check_native_availability()
         
         if not self._native_available:
@@ -72,33 +199,31 @@ class ViSQOL:
         
         self._init_native()
     
+    def __getstate__(self) -> Dict[str, Any]:
+        """
+        Pickle only the settings.
+        
+        The native API objects are pybind11 handles that cannot be
+        pickled, and their Measure call holds the GIL, so parallel work
+        runs in processes that rebuild them via __setstate__.
+        """
+        return {
+            'mode': self.mode,
+            'cache_dir': self.cache_dir,
+            'max_segment_seconds': self.max_segment_seconds,
+        }
+    
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        """Rebuild the native API from pickled settings."""
+        self.__init__(**state)
+    
     def _check_native_availability(self) -> bool:
         """Check if native ViSQOL implementation is available."""
-        try:
-            # Try to import the native ViSQOL library from our built package
-            import visqol_py.visqol_lib_py
-            import visqol_py.pb2.visqol_config_py_pb2
-            import visqol_py.pb2.similarity_result_py_pb2
-            return True
-        except ImportError:
-            try:
-                # Fallback to system-wide installation
-                from visqol import visqol_lib_py
-                from visqol.pb2 import visqol_config_pb2
-                return True
-            except ImportError:
-                return False
+        return _resolve_native_modules() is not None
     
     def _init_native(self):
         """Initialize native ViSQOL implementation."""
-        try:
-            # Try to use our built version first
-            import visqol_py.visqol_lib_py as visqol_lib_py
-            import visqol_py.pb2.visqol_config_py_pb2 as visqol_config_pb2
-        except ImportError:
-            # Fall back to system installation
-            from visqol import visqol_lib_py
-            from visqol.pb2 import visqol_config_pb2
+        visqol_lib_py, visqol_config_pb2 = _resolve_native_modules()
         
         self._config = visqol_config_pb2.VisqolConfig()
         
@@ -125,10 +250,14 @@ class ViSQOL:
         
         # Store libs for later use
         self._visqol_lib_py = visqol_lib_py
+        self._visqol_config_pb2 = visqol_config_pb2
         
         # Create API instance with default config
         self._api = visqol_lib_py.VisqolApi()
         self._api.Create(self._config)
+        
+        # APIs per sample rate; creating one loads the model from disk
+        self._api_cache: Dict[int, Any] = {self._config.audio.sample_rate: self._api}
     
     
     def measure(
@@ -146,9 +275,102 @@ class ViSQOL:
         Returns:
             ViSQOLResult containing MOS-LQO score and additional metrics
         """
+        if (
+            self.cache_dir is not None
+            and isinstance(reference, (str, Path))
+            and isinstance(degraded, (str, Path))
+        ):
+            return self._measure_cached(reference, degraded)
+        
+        if (
+            self.max_segment_seconds is None
+            and self._is_native_ready(reference)
+            and self._is_native_ready(degraded)
+        ):
+            return self._measure_arrays_fast(reference, degraded)
+        
         # Only native implementation is supported
         return self._measure_native(reference, degraded)
     
+    def _is_native_ready(self, audio) -> bool:
+        """Check whether audio can be handed to the native binding as is."""
+        return (
+            isinstance(audio, np.ndarray)
+            and audio.dtype == self._preferred_dtype
+            and audio.flags.c_contiguous
+            and audio.flags.writeable
+        )
+    
+    def _measure_arrays_fast(self, reference: np.ndarray, degraded: np.ndarray) -> ViSQOLResult:
+        """
+        Measure prepared arrays, skipping all loading and conversion.
+        
+        Arrays are taken to be at the mode's default sample rate, as in
+        the general path, so the default API is used directly.
+        """
+        return self._result_from_similarity(self._api.Measure(reference, degraded))
+    
+    def _measure_cached(self, reference: Union[str, Path], degraded: Union[str, Path]) -> ViSQOLResult:
+        """Measure a file pair, reusing a cached result for identical contents."""
+        cache_path = self.cache_dir / f"{self._result_cache_key(reference, degraded)}.json"
+        
+        try:
+            with open(cache_path, 'r') as f:
+                return ViSQOLResult(
+                    reference_path=os.fspath(reference),
+                    degraded_path=os.fspath(degraded),
+                    **json.load(f)
+                )
+        except (OSError, ValueError, TypeError):
+            # Missing or unreadable entry: measure and (re)write it
+            pass
+        
+        result = self._measure_native(reference, degraded)
+        self._store_cached_result(cache_path, result)
+        return result
+    
+    def _result_cache_key(self, reference: Union[str, Path], degraded: Union[str, Path]) -> str:
+        """Hash the mode and both files' contents into a cache key."""
+        settings = self.mode.value
+        if self.max_segment_seconds is not None:
+            # Segmented scores differ from whole-signal ones
+            settings += f":segment={self.max_segment_seconds!r}"
+        digest = hashlib.blake2b(settings.encode(), digest_size=16)
+        for path in (reference, degraded):
+            with open(path, 'rb') as f:
+                size = os.fstat(f.fileno()).st_size
+                # Length prefix keeps (ref, deg) boundaries unambiguous
+                digest.update(struct.pack('<Q', size))
+                if size:
+                    # Hash straight from the page cache, without read() copies
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapping:
+                        digest.update(mapping)
+        return digest.hexdigest()
+    
+    def _store_cached_result(self, cache_path: Path, result: ViSQOLResult) -> None:
+        """Atomically write a result to the cache, ignoring I/O errors."""
+        data = {
+            'moslqo': result.moslqo,
+            'vnsim': result.vnsim,
+            'fvnsim': list(result.fvnsim),
+            'center_freq_bands': list(result.center_freq_bands),
+            'patch_similarities': result.patch_similarities,
+        }
+        tmp_name = None
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            with tempfile.NamedTemporaryFile(
+                'w', dir=cache_path.parent, suffix='.tmp', delete=False
+            ) as f:
+                tmp_name = f.name
+                json.dump(data, f)
+            # Readers see either the old entry or the complete new one
+            os.replace(tmp_name, cache_path)
+        except OSError:
+            # The cache is only an optimization; never fail a measurement
+            if tmp_name is not None and os.path.exists(tmp_name):
+                os.remove(tmp_name)
+    
     def _measure_native(
         self,
         reference: Union[str, np.ndarray, Path],
@@ -157,34 +379,127 @@ class ViSQOL:
         """Measure using native ViSQOL implementation."""
         # Load audio and determine actual sample rate
         ref_audio, actual_sr = self._load_audio_with_sr(reference)
-        deg_audio, _ = self._load_audio_with_sr(degraded)
         
         # Create API with correct sample rate if different from default
         api_to_use = self._get_api_for_sample_rate(actual_sr)
         
-        # Run ViSQOL
-        similarity_result = api_to_use.Measure(ref_audio, deg_audio)
+        return self._measure_loaded(api_to_use, ref_audio, actual_sr, reference, degraded)
+    
+    def measure_against_reference(
+        self,
+        reference: Union[str, np.ndarray, Path],
+        degraded_list: List[Union[str, np.ndarray, Path]]
+    ) -> List[ViSQOLResult]:
+        """
+        Compute ViSQOL scores of several degraded signals against one reference.
+        
+        The reference is loaded and resampled once and reused for every
+        degraded signal, instead of being reloaded for each measurement.
+        
+        Args:
+            reference: Reference audio (file path or numpy array)
+            degraded_list: Degraded audio signals (file paths or numpy arrays)
+            
+        Returns:
+            List of ViSQOLResult objects, one per degraded signal
+        """
+        ref_audio, actual_sr = self._load_audio_with_sr(reference)
+        api_to_use = self._get_api_for_sample_rate(actual_sr)
         
-        # Convert to our result format
+        return [
+            self._measure_loaded(api_to_use, ref_audio, actual_sr, reference, degraded)
+            for degraded in degraded_list
+        ]
+    
+    def _measure_loaded(
+        self,
+        api_to_use,
+        ref_audio: np.ndarray,
+        sample_rate: int,
+        reference: Union[str, np.ndarray, Path],
+        degraded: Union[str, np.ndarray, Path]
+    ) -> ViSQOLResult:
+        """Measure degraded audio against an already loaded reference."""
+        if _is_same_audio(reference, degraded):
+            # Sanity-check pairs: reuse the loaded reference instead of
+            # decoding and resampling the same samples again
+            deg_audio = ref_audio
+        else:
+            # Resample the degraded file straight to the reference's rate,
+            # in one pass, so both signals match the API's configured rate
+            deg_audio, _ = self._load_audio_with_sr(degraded, target_sr=sample_rate)
+        
+        if (
+            self.max_segment_seconds is not None
+            and len(ref_audio) > self.max_segment_seconds * sample_rate
+        ):
+            result = self._measure_segmented(api_to_use, ref_audio, deg_audio, sample_rate)
+        else:
+            # Run ViSQOL
+            result = self._result_from_similarity(api_to_use.Measure(ref_audio, deg_audio))
+        
+        result.reference_path = os.fspath(reference) if isinstance(reference, (str, Path)) else None
+        result.degraded_path = os.fspath(degraded) if isinstance(degraded, (str, Path)) else None
+        return result
+    
+    def _result_from_similarity(self, similarity_result) -> ViSQOLResult:
+        """Convert a native similarity result to our result format."""
         return ViSQOLResult(
             moslqo=similarity_result.moslqo,
             vnsim=similarity_result.vnsim,
             fvnsim=list(similarity_result.fvnsim),
             center_freq_bands=list(similarity_result.center_freq_bands),
-            reference_path=str(reference) if isinstance(reference, (str, Path)) else None,
-            degraded_path=str(degraded) if isinstance(degraded, (str, Path)) else None,
+        )
+    
+    def _measure_segmented(
+        self,
+        api_to_use,
+        ref_audio: np.ndarray,
+        deg_audio: np.ndarray,
+        sample_rate: int
+    ) -> ViSQOLResult:
+        """
+        Measure long signals segment by segment and combine the scores.
+        
+        Segments overlap so that alignment offsets near a boundary are
+        still found; per-segment scores are averaged weighted by length.
+        """
+        bounds = _segment_bounds(
+            len(ref_audio),
+            int(self.max_segment_seconds * sample_rate),
+            int(_SEGMENT_OVERLAP_SECONDS * sample_rate)
+        )
+        
+        weights = []
+        segment_results = []
+        for start, stop in bounds:
+            deg_segment = deg_audio[start:stop]
+            if len(deg_segment) == 0:
+                break
+            segment_results.append(api_to_use.Measure(ref_audio[start:stop], deg_segment))
+            weights.append(stop - start)
+        if not segment_results:
+            raise ValueError("Degraded audio is empty")
+        
+        weights = np.asarray(weights, dtype=np.float64)
+        weights /= weights.sum()
+        fvnsim = np.array([list(r.fvnsim) for r in segment_results], dtype=np.float64)
+        
+        return ViSQOLResult(
+            moslqo=float(np.dot(weights, [r.moslqo for r in segment_results])),
+            vnsim=float(np.dot(weights, [r.vnsim for r in segment_results])),
+            fvnsim=(weights @ fvnsim).tolist(),
+            center_freq_bands=list(segment_results[0].center_freq_bands),
         )
     
     def _get_api_for_sample_rate(self, sample_rate: int):
         """Get or create API instance for specific sample rate."""
-        # If sample rate matches current config, use existing API
-        if sample_rate == self._config.audio.sample_rate:
-            return self._api
+        api = self._api_cache.get(sample_rate)
+        if api is not None:
+            return api
         
         # Create new API with correct sample rate
-        import visqol_py.pb2.visqol_config_py_pb2 as visqol_config_pb2
-        
-        config = visqol_config_pb2.VisqolConfig()
+        config = self._visqol_config_pb2.VisqolConfig()
         config.audio.sample_rate = sample_rate
         
         # Copy all options from original config
@@ -198,26 +513,46 @@ class ViSQOL:
         # Create new API instance
         api = self._visqol_lib_py.VisqolApi()
         api.Create(config)
+        self._api_cache[sample_rate] = api
         return api
     
-    def _load_audio_with_sr(self, audio: Union[str, np.ndarray, Path]) -> Tuple[np.ndarray, int]:
-        """Load audio and return both data and actual sample rate used."""
+    def _load_audio_with_sr(
+        self,
+        audio: Union[str, np.ndarray, Path],
+        target_sr: Optional[int] = None
+    ) -> Tuple[np.ndarray, int]:
+        """
+        Load audio and return both data and actual sample rate used.
+        
+        Files are resampled to target_sr when given, otherwise to the
+        mode's target for their original rate.
+        """
         if isinstance(audio, np.ndarray):
             # For numpy arrays, assume they match the default config sample rate
             default_sr = 16000 if self.mode == ViSQOLMode.SPEECH else 48000
-            return audio.astype(np.float64), default_sr
+            return self._as_native_samples(audio), default_sr
         
         # Load WAV file
-        audio_data, orig_sr = self._load_wav_file(str(audio))
+        audio_data, orig_sr = self._load_wav_file(os.fspath(audio))
         
         # Determine target sample rate
-        target_sr = self._get_target_sample_rate(orig_sr)
+        if target_sr is None:
+            target_sr = self._get_target_sample_rate(orig_sr)
         
         # Resample if needed
         if orig_sr != target_sr:
             audio_data = self._resample_audio(audio_data, orig_sr, target_sr)
         
-        return audio_data.astype(np.float64), target_sr
+        return self._as_native_samples(audio_data), target_sr
+    
+    def _as_native_samples(self, audio: np.ndarray) -> np.ndarray:
+        """
+        Convert audio to the layout the native binding takes without copying.
+        
+        Arrays that already are writable, C-contiguous float64 are passed
+        through unchanged; anything else is converted once.
+        """
+        return np.require(audio, dtype=self._preferred_dtype, requirements=['C', 'W'])
     
     
     def _get_target_sample_rate(self, original_sr: int) -> int:
@@ -228,67 +563,163 @@ class ViSQOL:
         - Speech mode: Use original SR if >= 16kHz, otherwise upsample to 16kHz
         - Audio mode: Always use 48kHz
         """
-        if self.mode == ViSQOLMode.SPEECH:
-            # In speech mode, if original is already >= 16kHz, keep it
-            # This matches how original ViSQOL handles 48kHz files in speech mode
-            if original_sr >= 16000:
-                return original_sr
-            else:
-                return 16000
-        else:  # AUDIO mode
-            return 48000
+        return _target_sample_rate(self.mode, original_sr)
     
     def measure_batch(
         self,
-        file_pairs: List[tuple],
-        output_csv: Optional[str] = None
+        file_pairs: Iterable[tuple],
+        output_csv: Optional[str] = None,
+        n_jobs: int = 1
     ) -> List[ViSQOLResult]:
         """
         Measure ViSQOL scores for multiple file pairs.
         
         Args:
-            file_pairs: List of (reference_path, degraded_path) tuples
+            file_pairs: Iterable of (reference, degraded) tuples, each a file
+                path or a numpy array; arrays skip WAV decoding entirely
             output_csv: Optional path to save results as CSV
+            n_jobs: Number of worker processes; 1 measures serially in
+                this process
+            
+        Returns:
+            List of ViSQOLResult objects, in the order of file_pairs
+        """
+        return list(self.iter_measure_batch(file_pairs, output_csv=output_csv, n_jobs=n_jobs))
+    
+    def iter_measure_batch(
+        self,
+        file_pairs: Iterable[tuple],
+        output_csv: Optional[str] = None,
+        n_jobs: int = 1
+    ) -> Iterator[ViSQOLResult]:
+        """
+        Measure ViSQOL scores for multiple file pairs, one result at a time.
+        
+        Results are yielded in the order of file_pairs as soon as they are
+        available and written to output_csv as they arrive, flushed every
+        few dozen rows, so long runs neither hold every result in memory
+        nor lose finished rows when a later pair fails.
+        
+        Args:
+            file_pairs: Iterable of (reference, degraded) tuples, each a file
+                path or a numpy array; arrays skip WAV decoding entirely
+            output_csv: Optional path to stream results to as CSV
+            n_jobs: Number of worker processes; 1 measures serially in
+                this process
             
         Returns:
-            List of ViSQOLResult objects
+            Iterator over ViSQOLResult objects, in the order of file_pairs
+            
+        Raises:
+            FileNotFoundError: If any file in file_pairs does not exist;
+                raised by this call itself, before anything is measured
+                or written
         """
-        results = []
-        
-        for ref_path, deg_path in file_pairs:
-            try:
-                result = self.measure(ref_path, deg_path)
-                results.append(result)
-            except Exception as e:
-                error_msg = f"Failed to process {ref_path} vs {deg_path}: {e}"
-                warnings.warn(error_msg)
-                # Re-raise the exception - no fake results
-                raise RuntimeError(error_msg) from e
-        
-        # Save to CSV if requested
-        if output_csv:
-            self._save_batch_results(results, output_csv)
-        
-        return results
-    
-    def _save_batch_results(self, results: List[ViSQOLResult], output_path: str):
-        """Save batch results to CSV file."""
-        import csv
-        
-        with open(output_path, 'w', newline='') as csvfile:
-            writer = csv.writer(csvfile)
-            writer.writerow(['reference', 'degraded', 'moslqo'])
+        # Accept any iterable of pairs, as measure_batch always has, and
+        # check them here rather than on the generator's first next()
+        file_pairs = list(file_pairs)
+        _check_batch_files(file_pairs)
+        return self._iter_measure_batch(file_pairs, output_csv, n_jobs)
+    
+    def _iter_measure_batch(
+        self,
+        file_pairs: List[tuple],
+        output_csv: Optional[str],
+        n_jobs: int
+    ) -> Iterator[ViSQOLResult]:
+        """Measure checked pairs, streaming rows to output_csv; see iter_measure_batch."""
+        n_jobs = max(1, min(n_jobs, len(file_pairs)))
+        
+        with ExitStack() as stack:
+            csvfile = None
+            if output_csv:
+                csvfile = stack.enter_context(open(output_csv, 'w', newline='', buffering=1 << 20))
+                csvfile.write('reference,degraded,moslqo' + _CSV_LINE_END)
             
-            for result in results:
-                writer.writerow([
-                    result.reference_path or '',
-                    result.degraded_path or '',
-                    f"{result.moslqo:.6f}"
-                ])
+            if n_jobs == 1:
+                # References shared by consecutive pairs are loaded once
+                ref_cache: Dict[str, Tuple[np.ndarray, int]] = {}
+                results = (
+                    self._measure_pair(ref_path, deg_path, ref_cache)
+                    for ref_path, deg_path in file_pairs
+                )
+            else:
+                # Each worker builds its own ViSQOL once; small chunks keep
+                # the workers balanced when pair durations vary, and bound
+                # the work already dispatched when iteration stops early
+                chunksize = max(1, min(len(file_pairs) // (4 * n_jobs), _BATCH_MAX_CHUNK_PAIRS))
+                executor = stack.enter_context(ProcessPoolExecutor(
+                    max_workers=n_jobs,
+                    initializer=_init_batch_worker,
+                    initargs=(self,)
+                ))
+                futures = [
+                    executor.submit(_measure_batch_chunk, file_pairs[start:start + chunksize])
+                    for start in range(0, len(file_pairs), chunksize)
+                ]
+                # Exits run in reverse, so this precedes the executor's
+                # shutdown: if the consumer stops early, chunks that have
+                # not started are dropped instead of measured
+                stack.callback(_cancel_futures, futures)
+                results = (result for future in futures for result in future.result())
+            
+            for i, result in enumerate(results, 1):
+                if csvfile is not None:
+                    csvfile.write(_format_batch_row(result))
+                    # Bound what a killed run can lose without a flush per row
+                    if i % _BATCH_CSV_FLUSH_ROWS == 0:
+                        csvfile.flush()
+                yield result
+    
+    def _measure_pair(
+        self,
+        ref_path: Union[str, np.ndarray, Path],
+        deg_path: Union[str, np.ndarray, Path],
+        ref_cache: Optional[Dict[str, Tuple[np.ndarray, int]]] = None
+    ) -> ViSQOLResult:
+        """
+        Measure one batch pair, reporting which pair failed.
+        
+        When ref_cache is given, reference files are loaded through it
+        so that pairs sharing a reference decode and resample it once.
+        """
+        try:
+            if (
+                ref_cache is not None
+                and self.cache_dir is None
+                and isinstance(ref_path, (str, Path))
+            ):
+                ref_audio, actual_sr = self._load_reference_cached(ref_path, ref_cache)
+                api_to_use = self._get_api_for_sample_rate(actual_sr)
+                return self._measure_loaded(api_to_use, ref_audio, actual_sr, ref_path, deg_path)
+            return self.measure(ref_path, deg_path)
+        except Exception as e:
+            error_msg = f"Failed to process {ref_path} vs {deg_path}: {e}"
+            warnings.warn(error_msg)
+            # Re-raise the exception - no fake results
+            raise RuntimeError(error_msg) from e
+    
+    def _load_reference_cached(
+        self,
+        reference: Union[str, Path],
+        ref_cache: Dict[str, Tuple[np.ndarray, int]]
+    ) -> Tuple[np.ndarray, int]:
+        """
+        Load a reference file, reusing it while consecutive pairs share it.
+        
+        Only the most recent reference is kept, which bounds the memory
+        held per process to one decoded signal.
+        """
+        key = os.fspath(reference)
+        loaded = ref_cache.get(key)
+        if loaded is None:
+            ref_cache.clear()
+            loaded = ref_cache[key] = self._load_audio_with_sr(reference)
+        return loaded
     
     def _resample_audio(self, audio: np.ndarray, orig_sr: int, target_sr: int) -> np.ndarray:
         """
-        Simple audio resampling using linear interpolation.
+        Resample audio with a polyphase anti-aliasing filter.
         
         Args:
             audio: Input audio data
@@ -298,28 +729,14 @@ class ViSQOL:
         Returns:
             Resampled audio data
         """
-        if orig_sr == target_sr:
-            return audio
-        
-        # Calculate resampling ratio
-        ratio = target_sr / orig_sr
+        # utils imports this module, so import it lazily
+        from .utils import resample_audio
         
-        # Create new time indices
-        orig_length = len(audio)
-        new_length = int(orig_length * ratio)
-        
-        # Linear interpolation
-        orig_indices = np.linspace(0, orig_length - 1, orig_length)
-        new_indices = np.linspace(0, orig_length - 1, new_length)
-        
-        # Interpolate
-        resampled = np.interp(new_indices, orig_indices, audio)
-        
-        return resampled
+        return resample_audio(audio, orig_sr, target_sr)
     
     def _load_wav_file(self, file_path: str) -> Tuple[np.ndarray, int]:
         """
-        Load WAV file using Python's built-in wave module.
+        Load WAV file, decoding its samples with vectorized NumPy operations.
         
         Args:
             file_path: Path to WAV file
@@ -327,70 +744,81 @@ class ViSQOL:
         Returns:
             Tuple of (audio_data, sample_rate)
         """
-        try:
-            with wave.open(file_path, 'rb') as wav_file:
-                # Get WAV file parameters
-                n_channels = wav_file.getnchannels()
-                sample_width = wav_file.getsampwidth()
-                sample_rate = wav_file.getframerate()
-                n_frames = wav_file.getnframes()
-                
-                # Read raw audio data
-                raw_audio = wav_file.readframes(n_frames)
-                
-                # Convert to numpy array based on sample width
-                if sample_width == 1:  # 8-bit
-                    audio_data = np.frombuffer(raw_audio, dtype=np.uint8)
-                    audio_data = (audio_data.astype(np.float32) - 128) / 128.0
-                elif sample_width == 2:  # 16-bit
-                    audio_data = np.frombuffer(raw_audio, dtype=np.int16)
-                    audio_data = audio_data.astype(np.float32) / 32768.0
-                elif sample_width == 3:  # 24-bit
-                    # Convert 24-bit to 32-bit integers
-                    audio_bytes = np.frombuffer(raw_audio, dtype=np.uint8)
-                    audio_data = []
-                    for i in range(0, len(audio_bytes), 3):
-                        # Convert 3 bytes to 24-bit signed integer
-                        sample = int.from_bytes(audio_bytes[i:i+3], 'little', signed=True)
-                        audio_data.append(sample)
-                    audio_data = np.array(audio_data, dtype=np.float32) / 8388608.0
-                elif sample_width == 4:  # 32-bit
-                    audio_data = np.frombuffer(raw_audio, dtype=np.int32)
-                    audio_data = audio_data.astype(np.float32) / 2147483648.0
-                else:
-                    raise ValueError(f"Unsupported sample width: {sample_width} bytes")
-                
-                # Convert to mono if stereo
-                if n_channels == 2:
-                    audio_data = audio_data.reshape(-1, 2)
-                    audio_data = np.mean(audio_data, axis=1)
-                elif n_channels > 2:
-                    audio_data = audio_data.reshape(-1, n_channels)
-                    audio_data = np.mean(audio_data, axis=1)
-                
-                return audio_data, sample_rate
-                
-        except Exception as e:
-            raise RuntimeError(f"Failed to load WAV file {file_path}: {e}")
-    
-    def _save_wav_file(self, audio_data: np.ndarray, file_path: str, sample_rate: int) -> None:
-        """
-        Save audio data as WAV file.
+        # utils imports this module, so import it lazily
+        from .utils import _load_wav_file
         
-        Args:
-            audio_data: Audio data array
-            file_path: Output file path
-            sample_rate: Sample rate
-        """
+        return _load_wav_file(file_path)
+
+
+def _is_same_audio(
+    reference: Union[str, np.ndarray, Path],
+    degraded: Union[str, np.ndarray, Path]
+) -> bool:
+    """Check whether both inputs are the same array or name the same file."""
+    if reference is degraded:
+        return True
+    if isinstance(reference, (str, Path)) and isinstance(degraded, (str, Path)):
         try:
-            # Convert to 16-bit integers
-            audio_int16 = (audio_data * 32767).astype(np.int16)
-            
-            with wave.open(file_path, 'wb') as wav_file:
-                wav_file.setnchannels(1)  # Mono
-                wav_file.setsampwidth(2)  # 16-bit
-                wav_file.setframerate(sample_rate)
-                wav_file.writeframes(audio_int16.tobytes())
-                
-        except Exception as e:
-            raise RuntimeError(f"Failed to save WAV file {file_path}: {e}")
\ No newline at end of file
+            return os.path.samefile(reference, degraded)
+        except OSError:
+            return False
+    return False
+
+
+def _check_batch_files(file_pairs: List[tuple]) -> None:
+    """Raise FileNotFoundError listing every missing file in file_pairs."""
+    paths = {
+        os.fspath(audio)
+        for pair in file_pairs
+        for audio in pair
+        if isinstance(audio, (str, Path))
+    }
+    missing = sorted(path for path in paths if not os.path.isfile(path))
+    if missing:
+        raise FileNotFoundError(f"Audio files not found: {', '.join(missing)}")
+
+
+def _format_batch_row(result: ViSQOLResult) -> str:
+    """Format one measure_batch CSV row, including the line break."""
+    return (
+        f"{_csv_escape(result.reference_path or '')},"
+        f"{_csv_escape(result.degraded_path or '')},"
+        f"{result.moslqo:.6f}{_CSV_LINE_END}"
+    )
+
+
+# Record terminator of every CSV file written, as csv.writer's default
+# (excel) dialect produces
+_CSV_LINE_END = '\r\n'
+
+
+def _csv_escape(value: str) -> str:
+    """Quote a CSV field if it contains a delimiter, quote or line break."""
+    if ',' in value or '"' in value or '\n' in value or '\r' in value:
+        return '"' + value.replace('"', '""') + '"'
+    return value
+
+
+# Per-process ViSQOL instance and decoded references used by measure_batch workers
+_worker_visqol: Optional[ViSQOL] = None
+_worker_ref_cache: Dict[str, Tuple[np.ndarray, int]] = {}
+
+
+def _init_batch_worker(visqol: ViSQOL) -> None:
+    """Keep the ViSQOL instance, rebuilt on unpickling, for a batch worker process."""
+    global _worker_visqol
+    _worker_visqol = visqol
+
+
+def _measure_batch_chunk(file_pairs: List[tuple]) -> List[ViSQOLResult]:
+    """Measure a chunk of (reference, degraded) pairs in a batch worker."""
+    return [
+        _worker_visqol._measure_pair(ref_path, deg_path, _worker_ref_cache)
+        for ref_path, deg_path in file_pairs
+    ]
+
+
+def _cancel_futures(futures: List[Future]) -> None:
+    """Cancel batch chunks that have not started running yet."""
+    for future in futures:
+        future.cancel()